@@ -63,6 +63,13 @@ VALID_TRANSITIONS = {
     ArtifactStatus.REVOKED: [],     # Terminal
 }
 
+# Statusgrupper för invariantkontrollen (byggs en gång, inte per anrop)
+_SUBMITTED_OR_LATER = frozenset({ArtifactStatus.SUBMITTED, ArtifactStatus.APPROVED,
+                                 ArtifactStatus.VERIFIED, ArtifactStatus.SUPERSEDED})
+_APPROVED_OR_LATER = frozenset({ArtifactStatus.APPROVED, ArtifactStatus.VERIFIED,
+                                ArtifactStatus.SUPERSEDED})
+_VERIFIED_OR_LATER = frozenset({ArtifactStatus.VERIFIED, ArtifactStatus.SUPERSEDED})
+
 
 @dataclass
 class ArtifactSource:
@@ -223,23 +230,22 @@ class Artifact:
         Returnerar lista med fel (tom om OK).
         """
         errors = []
+        status = self.status
         
         # SUBMITTED kräver content_hash
-        if self.status in [ArtifactStatus.SUBMITTED, ArtifactStatus.APPROVED, 
-                           ArtifactStatus.VERIFIED, ArtifactStatus.SUPERSEDED]:
+        if status in _SUBMITTED_OR_LATER:
             if not self.content_hash:
                 errors.append("SUBMITTED+ kräver content_hash")
         
         # APPROVED kräver approval
-        if self.status in [ArtifactStatus.APPROVED, ArtifactStatus.VERIFIED, 
-                           ArtifactStatus.SUPERSEDED]:
+        if status in _APPROVED_OR_LATER:
             if not self.approval:
                 errors.append("APPROVED+ kräver approval")
             elif not self.approval.approval_id:
                 errors.append("APPROVED+ kräver approval.approval_id")
         
         # VERIFIED kräver x_vault med snapshot
-        if self.status in [ArtifactStatus.VERIFIED, ArtifactStatus.SUPERSEDED]:
+        if status in _VERIFIED_OR_LATER:
             if not self.x_vault:
                 errors.append("VERIFIED+ kräver x_vault")
             elif not self.x_vault.snapshot_id:
@@ -250,7 +256,7 @@ class Artifact:
                 errors.append("VERIFIED+ kräver verified_at")
         
         # SUPERSEDED kräver superseded_by
-        if self.status == ArtifactStatus.SUPERSEDED:
+        if status == ArtifactStatus.SUPERSEDED:
             if not self.lineage.superseded_by:
                 errors.append("SUPERSEDED kräver lineage.superseded_by")
         
@@ -29,8 +29,11 @@ if os.environ.get("CAS_PROBE_DISABLED", "").lower() not in ("1", "true", "yes"):
         pass
 # ============================================================================
 
+import asyncio
+import importlib.util
 import json
 import yaml
+from collections import Counter
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import Optional, List, Dict, Any
@@ -38,11 +41,20 @@ from typing import Optional, List, Dict, Any
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse
 from pydantic import BaseModel
 import uvicorn
 import httpx
 
+# Optional: orjson for fast response encoding (falls back to stdlib json).
+# ORJSONResponse imports fine without orjson and only fails when rendering,
+# so orjson itself is looked up before it becomes the default.
+try:
+    from fastapi.responses import ORJSONResponse
+    DefaultResponse = ORJSONResponse if importlib.util.find_spec("orjson") else JSONResponse
+except ImportError:
+    DefaultResponse = JSONResponse
+
 # Lägg till core i path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent))
 
@@ -203,7 +215,8 @@ class RejectRequest(BaseModel):
 app = FastAPI(
     title="EVE Artifact Approval API",
     description="API for Artifact Approval Witness UI",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=DefaultResponse
 )
 
 # CORS
@@ -355,26 +368,27 @@ async def root():
 
 
 @app.get("/api/artifacts")
-async def list_artifacts(project_id: Optional[str] = None):
+def list_artifacts(project_id: Optional[str] = None):
     """List all artifacts."""
     artifacts = get_artifact_list()
     
     if project_id:
         artifacts = [a for a in artifacts if a.get('project_id') == project_id]
     
+    by_status = Counter(a["status"] for a in artifacts)
     return {
         "artifacts": artifacts,
         "total": len(artifacts),
-        "pending": len([a for a in artifacts if a["status"] == "PENDING"]),
-        "approved": len([a for a in artifacts if a["status"] == "APPROVED"]),
-        "rejected": len([a for a in artifacts if a["status"] == "REJECTED"]),
-        "eve_verified": len([a for a in artifacts if a.get("eve_verified")]),
+        "pending": by_status["PENDING"],
+        "approved": by_status["APPROVED"],
+        "rejected": by_status["REJECTED"],
+        "eve_verified": sum(1 for a in artifacts if a.get("eve_verified")),
         "last_action": get_last_action()
     }
 
 
 @app.get("/api/artifacts/{artifact_id}")
-async def get_artifact(artifact_id: str):
+def get_artifact(artifact_id: str):
     """Get artifact details."""
     artifact_path = ARTIFACTS_BASE / artifact_id
     
@@ -439,7 +453,7 @@ async def approve(artifact_id: str, request: ApproveRequest):
             project_id=request.project_id
         )
         
-        log_audit("APPROVED", artifact_id, request.approved_by, f"via Trinity: {request.note}")
+        await asyncio.to_thread(log_audit, "APPROVED", artifact_id, request.approved_by, f"via Trinity: {request.note}")
         
         return {
             "success": True,
@@ -483,7 +497,7 @@ async def reject(artifact_id: str, request: RejectRequest):
             project_id=request.project_id
         )
         
-        log_audit("REJECTED", artifact_id, request.rejected_by, f"via Trinity: {request.reason}")
+        await asyncio.to_thread(log_audit, "REJECTED", artifact_id, request.rejected_by, f"via Trinity: {request.reason}")
         
         return {
             "success": True,
@@ -500,7 +514,7 @@ async def reject(artifact_id: str, request: RejectRequest):
 
 
 @app.post("/api/artifacts/{artifact_id}/seal")
-async def seal(artifact_id: str, sealed_by: str = "api"):
+def seal(artifact_id: str, sealed_by: str = "api"):
     """Seal an artifact (create/update X-Vault hash)."""
     artifact_path = ARTIFACTS_BASE / artifact_id
     
@@ -527,7 +541,7 @@ async def seal(artifact_id: str, sealed_by: str = "api"):
 
 
 @app.get("/api/audit")
-async def get_audit_log(limit: int = 50):
+def get_audit_log(limit: int = 50):
     """Get recent audit log entries."""
     if not AUDIT_LOG.exists():
         return {"entries": []}
@@ -554,22 +568,23 @@ async def get_audit_log(limit: int = 50):
 
 
 @app.get("/api/stats")
-async def get_stats():
+def get_stats():
     """Get statistics."""
     artifacts = get_artifact_list()
+    by_status = Counter(a["status"] for a in artifacts)
     
     return {
         "total": len(artifacts),
-        "pending": len([a for a in artifacts if a["status"] == "PENDING"]),
-        "approved": len([a for a in artifacts if a["status"] == "APPROVED"]),
-        "rejected": len([a for a in artifacts if a["status"] == "REJECTED"]),
-        "no_manifest": len([a for a in artifacts if a["status"] == "NO_MANIFEST"]),
-        "sealed": len([a for a in artifacts if a["sealed"]])
+        "pending": by_status["PENDING"],
+        "approved": by_status["APPROVED"],
+        "rejected": by_status["REJECTED"],
+        "no_manifest": by_status["NO_MANIFEST"],
+        "sealed": sum(1 for a in artifacts if a["sealed"])
     }
 
 
 @app.post("/api/refresh-from-factory")
-async def refresh_from_factory():
+def refresh_from_factory():
     """
     Refresh all artifacts from factory disk and seal with X-Vault.
     
@@ -668,7 +683,7 @@ async def refresh_from_factory():
 # ============================================
 
 @app.get("/api/verified/{artifact_id}")
-async def get_verified_status(artifact_id: str):
+def get_verified_status(artifact_id: str):
     """Get EVE VERIFIED status for an artifact."""
     if not VERIFIED_STORE_AVAILABLE:
         return {
@@ -702,7 +717,7 @@ async def get_verified_status(artifact_id: str):
 
 
 @app.get("/api/verified")
-async def list_verified_artifacts(status: Optional[str] = "ACTIVE"):
+def list_verified_artifacts(status: Optional[str] = "ACTIVE"):
     """List all EVE VERIFIED artifacts."""
     if not VERIFIED_STORE_AVAILABLE:
         return {
@@ -737,7 +752,7 @@ async def list_verified_artifacts(status: Optional[str] = "ACTIVE"):
 
 
 @app.post("/api/verified/verify/{evev_id}")
-async def verify_evev_integrity(evev_id: str):
+def verify_evev_integrity(evev_id: str):
     """Verify integrity of an EVEV record."""
     if not VERIFIED_STORE_AVAILABLE:
         raise HTTPException(status_code=500, detail="Verified store not available")
@@ -751,7 +766,7 @@ async def verify_evev_integrity(evev_id: str):
 
 
 @app.get("/api/verified/stats")
-async def get_verified_stats():
+def get_verified_stats():
     """Get EVE VERIFIED statistics."""
     if not VERIFIED_STORE_AVAILABLE:
         return {
@@ -311,10 +311,10 @@ class AuthorizationModule:
         
         # Kontrollera om tillräckligt många har godkänt
         min_approvers = requirements.get("min_approvers", 1)
-        approved_count = len([
-            a for a in request.approval_chain 
+        approved_count = sum(
+            1 for a in request.approval_chain
             if a["decision"] == AuthorizationStatus.APPROVED.value
-        ])
+        )
         
         if decision == AuthorizationStatus.APPROVED and approved_count >= min_approvers:
             request.status = AuthorizationStatus.APPROVED
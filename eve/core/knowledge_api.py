@@ -39,17 +39,27 @@ if os.environ.get("CAS_PROBE_DISABLED", "").lower() not in ("1", "true", "yes"):
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse
 from pydantic import BaseModel
 from pathlib import Path
 from typing import List, Optional, Dict
 from datetime import datetime
 import hashlib
+import importlib.util
 import json
 import sys
 import os
 import uvicorn
 
+# Optional: orjson for fast response encoding (falls back to stdlib json).
+# ORJSONResponse imports fine without orjson and only fails when rendering,
+# so orjson itself is looked up before it becomes the default.
+try:
+    from fastapi.responses import ORJSONResponse
+    DefaultResponse = ORJSONResponse if importlib.util.find_spec("orjson") else JSONResponse
+except ImportError:
+    DefaultResponse = JSONResponse
+
 # HTTP client for Trinity sync
 try:
     import httpx
@@ -214,7 +224,8 @@ except ImportError as e:
 app = FastAPI(
     title="EVE Knowledge API",
     description="Knowledge approval with Trinity cloud sync.",
-    version="6.0.0"
+    version="6.0.0",
+    default_response_class=DefaultResponse
 )
 
 app.add_middleware(
@@ -27,7 +27,18 @@ from datetime import datetime, timezone
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict, field
 from enum import Enum
+from concurrent.futures import ThreadPoolExecutor
 import sys
+import tempfile
+import time
+import functools
+
+# Optional: orjson for fast JSON encoding (falls back to stdlib json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 
 # ============================================================
@@ -50,6 +61,34 @@ PENDING_PATH = KNOWLEDGE_PATH / "pending"
 ARCHIVE_PATH = KNOWLEDGE_PATH / "archive"
 RAW_PATH = KNOWLEDGE_PATH / "raw"  # Original fetched content
 
+# Upper bound for concurrent placeholder writes in generate_batch
+MAX_WRITE_WORKERS = 16
+
+
+@functools.lru_cache(maxsize=32)
+def _regulation_dir(regulation: str) -> Path:
+    return KNOWLEDGE_PATH / "documents/eu" / regulation
+
+
+@functools.lru_cache(maxsize=32)
+def _articles_dir(regulation: str) -> Path:
+    return _regulation_dir(regulation) / "articles"
+
+
+@functools.lru_cache(maxsize=32)
+def _pending_dir(regulation: str) -> Path:
+    return PENDING_PATH / regulation
+
+
+@functools.lru_cache(maxsize=32)
+def _archive_dir(regulation: str) -> Path:
+    return ARCHIVE_PATH / regulation
+
+
+@functools.lru_cache(maxsize=32)
+def _rejected_dir(regulation: str) -> Path:
+    return ARCHIVE_PATH / "rejected" / regulation
+
 
 # ============================================================
 # STATUS & LEVELS
@@ -64,6 +103,14 @@ class ArticleStatus(Enum):
     REJECTED = "REJECTED"             # Human rejected
 
 
+# Statuses that generate_batch must never overwrite with a placeholder
+_PROTECTED_STATUSES = frozenset({
+    ArticleStatus.APPROVED.value,
+    ArticleStatus.SEALED.value,
+    ArticleStatus.PENDING_REVIEW.value,
+})
+
+
 class KnowledgeLevel(Enum):
     LEVEL_1_LAW = "LEVEL_1_LAW"
     LEVEL_2_GUIDANCE = "LEVEL_2_GUIDANCE"
@@ -173,7 +220,10 @@ class Article:
         return d
     
     def to_json(self) -> str:
-        return json.dumps(self.to_dict(), indent=2, ensure_ascii=False)
+        return self.to_json_bytes().decode('utf-8')
+    
+    def to_json_bytes(self) -> bytes:
+        return _dumps_pretty(self.to_dict())
 
 
 # ============================================================
@@ -193,6 +243,62 @@ def get_regulation_meta(regulation: str) -> Dict:
     return config["sources"]["eur_lex"]["regulations"].get(regulation, {})
 
 
+# ============================================================
+# FILE I/O
+# ============================================================
+
+def _dumps_pretty(obj) -> bytes:
+    """Indented UTF-8 JSON, same layout as json.dumps(indent=2, ensure_ascii=False)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+_WRITE_FLAGS = os.O_CREAT | os.O_WRONLY | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _write_all(fd: int, data: bytes, fsync: bool = False):
+    """Write every byte of data to an open file descriptor."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+    if fsync:
+        os.fsync(fd)
+
+
+def _write_bytes(path: Path, data: bytes, fsync: bool = False):
+    """Write pre-encoded bytes with a bare open/write/close (no text layer)."""
+    fd = os.open(path, _WRITE_FLAGS, 0o644)
+    try:
+        _write_all(fd, data, fsync)
+    finally:
+        os.close(fd)
+
+
+def _write_atomic(path: Path, data: bytes):
+    """
+    Write to a uniquely named temp file in the same directory, then os.replace()
+    so readers never see a partial file.
+    
+    The temp name comes from mkstemp, so concurrent writers of the same path
+    (batch workers, parallel fetches) never share or clobber each other's temp file.
+    """
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+    try:
+        try:
+            _write_all(fd, data, fsync=True)
+        finally:
+            os.close(fd)
+        os.chmod(tmp, 0o644)  # mkstemp creates 0600; match _write_bytes
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
 # ============================================================
 # STEG A: PLACEHOLDER GENERATION (Qwen + EVE)
 # ============================================================
@@ -216,7 +322,8 @@ class PlaceholderGenerator:
     def _timestamp(self) -> str:
         return datetime.now(timezone.utc).isoformat()
     
-    def generate_placeholder(self, regulation: str, article_num: int, title: str = None) -> Article:
+    def generate_placeholder(self, regulation: str, article_num: int, title: str = None,
+                             timestamp: str = None) -> Article:
         """Generate a single placeholder article."""
         
         meta = get_regulation_meta(regulation)
@@ -226,7 +333,8 @@ class PlaceholderGenerator:
         if title is None:
             title = f"Article {article_num}"
         
-        timestamp = self._timestamp()
+        if timestamp is None:
+            timestamp = self._timestamp()
         
         # Placeholder content - clearly marked
         placeholder_text = (
@@ -287,26 +395,25 @@ class PlaceholderGenerator:
             articles = [int(article_range)]
         
         # Output directory
-        output_dir = KNOWLEDGE_PATH / "documents/eu" / regulation / "articles"
+        output_dir = _articles_dir(regulation)
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        created = []
-        skipped = 0
+        # One directory listing instead of a stat() per article
+        existing = {entry.name for entry in os.scandir(output_dir)}
         
-        for num in articles:
-            path = output_dir / f"article_{num}.json"
-            
-            # Don't overwrite approved content
-            if path.exists():
-                existing = json.loads(path.read_text(encoding='utf-8'))
-                status = existing.get("eve_metadata", {}).get("status", "")
-                if status in ["APPROVED", "SEALED", "PENDING_REVIEW"]:
-                    skipped += 1
-                    continue
-            
-            article = self.generate_placeholder(regulation, num)
-            path.write_text(article.to_json(), encoding='utf-8')
-            created.append(path)
+        # One creation timestamp for the whole batch
+        timestamp = self._timestamp()
+        
+        # File-write bound: issue writes concurrently, capped to avoid FD exhaustion
+        workers = max(1, min(MAX_WRITE_WORKERS, len(articles)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(
+                lambda num: self._write_placeholder(regulation, output_dir, num, existing, timestamp),
+                articles
+            ))
+        
+        created = [path for path in results if path is not None]
+        skipped = len(results) - len(created)
         
         print(f"✅ Created {len(created)} placeholders for {regulation.upper()}")
         if skipped:
@@ -314,16 +421,32 @@ class PlaceholderGenerator:
         
         return created
     
+    def _write_placeholder(self, regulation: str, output_dir: Path, num: int,
+                           existing: set, timestamp: str) -> Optional[Path]:
+        """Write a single placeholder. Returns None if existing content is kept."""
+        path = output_dir / f"article_{num}.json"
+        
+        # Don't overwrite approved content
+        if path.name in existing:
+            data = json.loads(path.read_text(encoding='utf-8'))
+            status = data.get("eve_metadata", {}).get("status", "")
+            if status in _PROTECTED_STATUSES:
+                return None
+        
+        article = self.generate_placeholder(regulation, num, timestamp=timestamp)
+        _write_bytes(path, article.to_json_bytes())
+        return path
+    
     def generate_index(self, regulation: str) -> Path:
         """Generate index file for a regulation."""
         
         meta = get_regulation_meta(regulation)
-        articles_dir = KNOWLEDGE_PATH / "documents/eu" / regulation / "articles"
+        articles_dir = _articles_dir(regulation)
         
         articles = []
         status_counts = {s.value: 0 for s in ArticleStatus}
         
-        for f in sorted(articles_dir.glob("article_*.json")):
+        for f in articles_dir.glob("article_*.json"):
             data = json.loads(f.read_text(encoding='utf-8'))
             status = data.get("eve_metadata", {}).get("status", "UNKNOWN")
             status_counts[status] = status_counts.get(status, 0) + 1
@@ -336,6 +459,9 @@ class PlaceholderGenerator:
                 "approved": data.get("eve_metadata", {}).get("approved", False)
             })
         
+        # Numeric article order (glob/lexicographic order puts 10 before 2)
+        articles.sort(key=lambda a: int(a["article_number"]))
+        
         index = {
             "regulation": meta["short_name"],
             "regulation_full": meta["full_name"],
@@ -348,8 +474,8 @@ class PlaceholderGenerator:
             "articles": articles
         }
         
-        index_path = KNOWLEDGE_PATH / "documents/eu" / regulation / "index.json"
-        index_path.write_text(json.dumps(index, indent=2, ensure_ascii=False), encoding='utf-8')
+        index_path = _regulation_dir(regulation) / "index.json"
+        _write_atomic(index_path, _dumps_pretty(index))
         
         return index_path
 
@@ -358,6 +484,22 @@ class PlaceholderGenerator:
 # STEG B: EUR-LEX FETCH (EVE + Claude)
 # ============================================================
 
+# HTML cleanup patterns, compiled once for all articles
+_TAG_RE = re.compile(r'<[^>]+>')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+@functools.lru_cache(maxsize=1024)
+def _article_patterns(article_num: int) -> Tuple[re.Pattern, ...]:
+    """Compiled EUR-Lex article-boundary patterns for one article number."""
+    return (
+        re.compile(rf'Article\s+{article_num}\s*</p>(.*?)(?=Article\s+\d+\s*</p>|</body>)',
+                   re.DOTALL | re.IGNORECASE),
+        re.compile(rf'<p[^>]*>Article\s+{article_num}[^<]*</p>(.*?)(?=<p[^>]*>Article\s+\d+)',
+                   re.DOTALL | re.IGNORECASE),
+    )
+
+
 class EURLexFetcher:
     """
     Fetches legal text from EUR-Lex.
@@ -412,18 +554,13 @@ class EURLexFetcher:
         """
         # EUR-Lex uses specific HTML structure
         # Look for Article N pattern
-        patterns = [
-            rf'Article\s+{article_num}\s*</p>(.*?)(?=Article\s+\d+\s*</p>|</body>)',
-            rf'<p[^>]*>Article\s+{article_num}[^<]*</p>(.*?)(?=<p[^>]*>Article\s+\d+)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, html, re.DOTALL | re.IGNORECASE)
+        for pattern in _article_patterns(article_num):
+            match = pattern.search(html)
             if match:
                 raw_text = match.group(1)
                 # Clean HTML tags
-                text = re.sub(r'<[^>]+>', ' ', raw_text)
-                text = re.sub(r'\s+', ' ', text).strip()
+                text = _TAG_RE.sub(' ', raw_text)
+                text = _WHITESPACE_RE.sub(' ', text).strip()
                 return text
         
         return None
@@ -467,11 +604,11 @@ class EURLexFetcher:
         article.content_hash = article.compute_hash()
         
         # Save to pending
-        pending_dir = PENDING_PATH / regulation
+        pending_dir = _pending_dir(regulation)
         pending_dir.mkdir(parents=True, exist_ok=True)
         
         path = pending_dir / f"article_{article_num}.json"
-        path.write_text(article.to_json(), encoding='utf-8')
+        _write_bytes(path, article.to_json_bytes())
         
         return path
 
@@ -535,57 +672,59 @@ class ApprovalManager:
         data = json.loads(path.read_text(encoding='utf-8'))
         timestamp = self._timestamp()
         
+        meta = data["eve_metadata"]
+        article_number = data["article_number"]
+        regulation = data.get("regulation", "unknown")
+        
         # Update EVE metadata
-        data["eve_metadata"]["approved"] = True
-        data["eve_metadata"]["approved_by"] = approved_by
-        data["eve_metadata"]["approved_date"] = timestamp
+        meta["approved"] = True
+        meta["approved_by"] = approved_by
+        meta["approved_date"] = timestamp
         
         # Set status based on observation
         if observation:
-            data["eve_metadata"]["status"] = "APPROVED_WITH_OBSERVATION"
-            data["eve_metadata"]["observation"] = observation
+            meta["status"] = "APPROVED_WITH_OBSERVATION"
+            meta["observation"] = observation
         else:
-            data["eve_metadata"]["status"] = ArticleStatus.APPROVED.value
+            meta["status"] = ArticleStatus.APPROVED.value
         
         # Compute approval signature
         sig_content = f"{data['content_hash']}:{approved_by}:{timestamp}"
-        data["eve_metadata"]["approval_signature"] = self._compute_hash(sig_content)
+        signature = self._compute_hash(sig_content)
+        meta["approval_signature"] = signature
         
         # Move to active knowledge
-        reg = data.get("regulation", "unknown").lower().replace(" ", "_")
-        target_dir = KNOWLEDGE_PATH / "documents/eu" / reg / "articles"
+        reg = regulation.lower().replace(" ", "_")
+        target_dir = _articles_dir(reg)
         target_dir.mkdir(parents=True, exist_ok=True)
         
-        target_path = target_dir / f"article_{data['article_number']}.json"
+        target_path = target_dir / f"article_{article_number}.json"
         
         # Archive existing if present
         if target_path.exists():
-            archive_dir = ARCHIVE_PATH / reg
+            archive_dir = _archive_dir(reg)
             archive_dir.mkdir(parents=True, exist_ok=True)
-            # Use timestamp with time to avoid collisions
-            archive_name = f"article_{data['article_number']}_{timestamp[:19].replace(':', '-')}.json"
+            # Timestamp + monotonic suffix is unique per process, no exists() probing
+            archive_name = (
+                f"article_{article_number}_"
+                f"{timestamp[:19].replace(':', '-')}_{time.monotonic_ns()}.json"
+            )
             archive_path = archive_dir / archive_name
-            # If still exists (unlikely), add counter
-            counter = 1
-            while archive_path.exists():
-                archive_name = f"article_{data['article_number']}_{timestamp[:10]}_{counter}.json"
-                archive_path = archive_dir / archive_name
-                counter += 1
-            target_path.rename(archive_path)
+            os.replace(target_path, archive_path)
         
         # Write approved version
-        target_path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding='utf-8')
+        _write_atomic(target_path, _dumps_pretty(data))
         
         # Remove from pending
         path.unlink()
         
         return {
             "action": "APPROVED",
-            "article": f"{data['regulation']} Article {data['article_number']}",
+            "article": f"{regulation} Article {article_number}",
             "approved_by": approved_by,
             "timestamp": timestamp,
             "content_hash": data["content_hash"],
-            "approval_signature": data["eve_metadata"]["approval_signature"],
+            "approval_signature": signature,
             "target_path": str(target_path)
         }
     
@@ -598,26 +737,30 @@ class ApprovalManager:
         data = json.loads(path.read_text(encoding='utf-8'))
         timestamp = self._timestamp()
         
+        meta = data["eve_metadata"]
+        article_number = data["article_number"]
+        regulation = data.get("regulation", "unknown")
+        
         # Update metadata
-        data["eve_metadata"]["status"] = ArticleStatus.REJECTED.value
-        data["eve_metadata"]["rejected_by"] = rejected_by
-        data["eve_metadata"]["rejected_date"] = timestamp
-        data["eve_metadata"]["rejection_reason"] = reason
+        meta["status"] = ArticleStatus.REJECTED.value
+        meta["rejected_by"] = rejected_by
+        meta["rejected_date"] = timestamp
+        meta["rejection_reason"] = reason
         
         # Move to rejected archive
-        reg = data.get("regulation", "unknown").lower().replace(" ", "_")
-        rejected_dir = ARCHIVE_PATH / "rejected" / reg
+        reg = regulation.lower().replace(" ", "_")
+        rejected_dir = _rejected_dir(reg)
         rejected_dir.mkdir(parents=True, exist_ok=True)
         
-        rejected_path = rejected_dir / f"article_{data['article_number']}_{timestamp[:10]}.json"
-        rejected_path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding='utf-8')
+        rejected_path = rejected_dir / f"article_{article_number}_{timestamp[:10]}.json"
+        _write_atomic(rejected_path, _dumps_pretty(data))
         
         # Remove from pending
         path.unlink()
         
         return {
             "action": "REJECTED",
-            "article": f"{data['regulation']} Article {data['article_number']}",
+            "article": f"{regulation} Article {article_number}",
             "rejected_by": rejected_by,
             "reason": reason,
             "timestamp": timestamp
@@ -628,9 +771,37 @@ class ApprovalManager:
 # COVERAGE REPORT
 # ============================================================
 
+def _scan_regulation(reg: str) -> Dict:
+    """Count articles, approvals, placeholders and pending for one regulation."""
+    articles_dir = _articles_dir(reg)
+    pending_dir = _pending_dir(reg)
+    
+    count = 0
+    approved = 0
+    placeholder = 0
+    pending = len(list(pending_dir.glob("article_*.json"))) if pending_dir.exists() else 0
+    
+    if articles_dir.exists():
+        for f in articles_dir.glob("article_*.json"):
+            count += 1
+            data = json.loads(f.read_text(encoding='utf-8'))
+            status = data.get("eve_metadata", {}).get("status", "")
+            if status == "APPROVED":
+                approved += 1
+            elif status == "PLACEHOLDER":
+                placeholder += 1
+    
+    return {"count": count, "approved": approved, "placeholder": placeholder, "pending": pending}
+
+
 def print_coverage_report():
     """Print knowledge base coverage."""
     config = load_config()
+    regulations = config["sources"]["eur_lex"]["regulations"]
+    
+    # Regulations are independent and I/O-bound: scan them concurrently, print in order
+    with ThreadPoolExecutor(max_workers=max(1, len(regulations))) as executor:
+        scans = list(executor.map(_scan_regulation, regulations))
     
     print("\n" + "=" * 70)
     print("📊 EVE KNOWLEDGE BASE COVERAGE REPORT")
@@ -641,23 +812,11 @@ def print_coverage_report():
     total_approved = 0
     total_pending = 0
     
-    for reg, meta in config["sources"]["eur_lex"]["regulations"].items():
-        articles_dir = KNOWLEDGE_PATH / "documents/eu" / reg / "articles"
-        pending_dir = PENDING_PATH / reg
-        
-        count = len(list(articles_dir.glob("article_*.json"))) if articles_dir.exists() else 0
-        pending = len(list(pending_dir.glob("article_*.json"))) if pending_dir.exists() else 0
-        approved = 0
-        placeholder = 0
-        
-        if articles_dir.exists():
-            for f in articles_dir.glob("article_*.json"):
-                data = json.loads(f.read_text(encoding='utf-8'))
-                status = data.get("eve_metadata", {}).get("status", "")
-                if status == "APPROVED":
-                    approved += 1
-                elif status == "PLACEHOLDER":
-                    placeholder += 1
+    for (reg, meta), scan in zip(regulations.items(), scans):
+        count = scan["count"]
+        approved = scan["approved"]
+        placeholder = scan["placeholder"]
+        pending = scan["pending"]
         
         coverage = (count / meta["articles"]) * 100 if meta["articles"] > 0 else 0
         bar = "█" * int(coverage / 5) + "░" * (20 - int(coverage / 5))
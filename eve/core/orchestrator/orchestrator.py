@@ -12,12 +12,33 @@ D: Human Decision (beslut -> ansvar)
 E: Export (revision/tillsyn)
 """
 
+import asyncio
 import json
+import threading
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from typing import Any, Callable, Deque, Dict, List, Optional
+from dataclasses import dataclass
 from enum import Enum
 from uuid import uuid4
+from weakref import WeakValueDictionary
+from collections import Counter, deque
+from itertools import islice
+
+from ..witness_ai.witness_ai import WitnessQuery
+from ..authorization.authorization import User, Role
+from ..x_vault.x_vault import EvidenceType
+
+
+_UTC = timezone.utc
+
+
+def _now_iso() -> str:
+    """Aktuell UTC-tid som ISO 8601"""
+    return datetime.now(_UTC).isoformat()
+
+
+# Max antal FlowResult som hålls i minnet (äldsta faller bort)
+MAX_COMPLETED_FLOWS = 10000
 
 
 class FlowType(Enum):
@@ -29,7 +50,7 @@ class FlowType(Enum):
     EXPORT = "export"             # E: revision/tillsyn
 
 
-@dataclass
+@dataclass(slots=True, weakref_slot=True)
 class FlowContext:
     """Kontext för ett arbetsflöde"""
     flow_id: str
@@ -42,12 +63,20 @@ class FlowContext:
     metadata: Dict
     
     def to_dict(self) -> Dict:
-        result = asdict(self)
-        result['flow_type'] = self.flow_type.value
-        return result
+        # Platt dict utan asdict():s rekursiva kopiering - scope/metadata är read-only nedströms
+        return {
+            "flow_id": self.flow_id,
+            "flow_type": self.flow_type.value,
+            "user_id": self.user_id,
+            "org_id": self.org_id,
+            "suite_id": self.suite_id,
+            "scope": self.scope,
+            "started_at": self.started_at,
+            "metadata": self.metadata
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class FlowResult:
     """Resultat från ett arbetsflöde"""
     flow_id: str
@@ -56,6 +85,16 @@ class FlowResult:
     evidence_ids: List[str]
     completed_at: str
     errors: List[str]
+    
+    def to_dict(self) -> Dict:
+        return {
+            "flow_id": self.flow_id,
+            "success": self.success,
+            "output": self.output,
+            "evidence_ids": self.evidence_ids,
+            "completed_at": self.completed_at,
+            "errors": self.errors
+        }
 
 
 class Orchestrator:
@@ -83,8 +122,21 @@ class Orchestrator:
         self.x_vault = x_vault
         self.knowledge_base = knowledge_base
         
-        self.active_flows: Dict[str, FlowContext] = {}
-        self.completed_flows: List[FlowResult] = []
+        # Svaga referenser: flöden som startas men aldrig exekveras städas
+        # bort när anroparen släpper sin FlowContext
+        self.active_flows: "WeakValueDictionary[str, FlowContext]" = WeakValueDictionary()
+        self.completed_flows: Deque[FlowResult] = deque(maxlen=MAX_COMPLETED_FLOWS)
+        self._total_count = 0
+        self._success_count = 0
+        self._flow_type_counts: Counter = Counter()
+        self._history_lock = threading.Lock()
+        
+        # X-Vault-kedjan (last_hash + Merkle) får bara växa från en tråd åt gången
+        self._vault_lock = threading.Lock()
+        
+        # Väntande seal-anrop från samtidiga flöden (group commit, se _seal)
+        self._seal_pending: List[List[Any]] = []
+        self._seal_pending_lock = threading.Lock()
         
         # Suite -> Agent mapping
         self.suite_agents = {
@@ -113,6 +165,13 @@ class Orchestrator:
                 "knowledge/documents/internal/clinical/**"
             ]
         }
+        
+        # FlowType -> flödessteg (se execute)
+        self._flow_steps: Dict[FlowType, Callable[..., Any]] = {
+            FlowType.WITNESS_QUERY: self._witness_query_steps,
+            FlowType.HUMAN_DECISION: self._human_decision_steps,
+            FlowType.EXPORT: self._export_steps
+        }
     
     def start_flow(
         self,
@@ -144,13 +203,25 @@ class Orchestrator:
             org_id=org_id,
             suite_id=suite_id,
             scope=scope,
-            started_at=datetime.now(timezone.utc).isoformat(),
+            started_at=_now_iso(),
             metadata=metadata or {}
         )
         
         self.active_flows[context.flow_id] = context
         return context
     
+    def execute(self, context: FlowContext, *args) -> FlowResult:
+        """
+        Exekvera ett flöde via dispatch-tabellen (FlowType -> flödessteg).
+        
+        args skickas vidare till flödets steg, i samma ordning som för
+        motsvarande execute_*-metod.
+        """
+        steps = self._flow_steps.get(context.flow_type)
+        if steps is None:
+            raise ValueError(f"Inget exekverbart steg för flöde: {context.flow_type.value}")
+        return self._run_flow(context, steps, *args)
+    
     def execute_witness_query(
         self,
         context: FlowContext,
@@ -166,80 +237,7 @@ class Orchestrator:
         4. Output signeras/hashas
         5. Evidence skapas
         """
-        from .witness_ai.witness_ai import WitnessQuery
-        from .status_engine.status_engine import OutputStatus, EvidenceType
-        
-        evidence_ids = []
-        errors = []
-        
-        try:
-            # Steg 1: Skapa witness query
-            query = WitnessQuery(
-                query_id=str(uuid4()),
-                question=question,
-                scope=context.scope,
-                user_id=context.user_id,
-                role=role,
-                timestamp=datetime.now(timezone.utc).isoformat()
-            )
-            
-            # Steg 2: Exekvera query via witness AI
-            response = self.witness_ai.query(query)
-            
-            # Steg 3: Klassificera via status engine
-            status_result = self.status_engine.classify(
-                output=response.response,
-                sources=response.citations,
-                scope_documents=context.scope
-            )
-            
-            # Steg 4: Seal i X-Vault
-            evidence = self.x_vault.seal(
-                evidence_type=EvidenceType.WITNESS_RESPONSE,
-                content={
-                    "query": question,
-                    "response": status_result.output,
-                    "status": status_result.status.value,
-                    "sources": response.citations,
-                    "blocked_phrases": status_result.blocked_phrases
-                },
-                metadata={
-                    "flow_id": context.flow_id,
-                    "user_id": context.user_id,
-                    "suite_id": context.suite_id
-                }
-            )
-            evidence_ids.append(evidence.evidence_id)
-            
-            output = {
-                "response": status_result.output,
-                "status": status_result.status.value,
-                "sources": response.citations,
-                "hash": status_result.output_hash,
-                "disclaimer": response.disclaimer
-            }
-            success = True
-            
-        except Exception as e:
-            errors.append(str(e))
-            output = None
-            success = False
-        
-        result = FlowResult(
-            flow_id=context.flow_id,
-            success=success,
-            output=output,
-            evidence_ids=evidence_ids,
-            completed_at=datetime.now(timezone.utc).isoformat(),
-            errors=errors
-        )
-        
-        # Flytta till completed
-        if context.flow_id in self.active_flows:
-            del self.active_flows[context.flow_id]
-        self.completed_flows.append(result)
-        
-        return result
+        return self._run_flow(context, self._witness_query_steps, question, role)
     
     def execute_human_decision(
         self,
@@ -257,68 +255,10 @@ class Orchestrator:
         3. Beslut registreras med referenser
         4. X-Vault säkrar tidslinje
         """
-        from .authorization.authorization import AuthorizationAction, User, Role
-        from .x_vault.x_vault import EvidenceType
-        
-        evidence_ids = []
-        errors = []
-        
-        try:
-            # Steg 1: Skapa authorization request
-            # (Förenklad - i produktion hämtas user från identity provider)
-            approver = User(
-                user_id=approver_id,
-                name="",
-                email="",
-                role=Role[approver_role.upper()],
-                org_id=context.org_id,
-                active=True
-            )
-            
-            # Steg 2: Registrera beslut i X-Vault
-            evidence = self.x_vault.seal(
-                evidence_type=EvidenceType.AUTHORIZATION_DECISION,
-                content={
-                    "decision_type": decision_type,
-                    "decision_data": decision_data,
-                    "approver_id": approver_id,
-                    "approver_role": approver_role,
-                    "flow_id": context.flow_id
-                },
-                metadata={
-                    "suite_id": context.suite_id,
-                    "org_id": context.org_id
-                }
-            )
-            evidence_ids.append(evidence.evidence_id)
-            
-            output = {
-                "decision_type": decision_type,
-                "status": "recorded",
-                "evidence_id": evidence.evidence_id,
-                "hash": evidence.content_hash
-            }
-            success = True
-            
-        except Exception as e:
-            errors.append(str(e))
-            output = None
-            success = False
-        
-        result = FlowResult(
-            flow_id=context.flow_id,
-            success=success,
-            output=output,
-            evidence_ids=evidence_ids,
-            completed_at=datetime.now(timezone.utc).isoformat(),
-            errors=errors
+        return self._run_flow(
+            context, self._human_decision_steps,
+            decision_type, decision_data, approver_id, approver_role
         )
-        
-        if context.flow_id in self.active_flows:
-            del self.active_flows[context.flow_id]
-        self.completed_flows.append(result)
-        
-        return result
     
     def execute_export(
         self,
@@ -334,24 +274,26 @@ class Orchestrator:
         3. Offline-verifiering möjlig
         4. Export loggas som egen bevisartefakt
         """
-        evidence_ids = []
-        errors = []
+        return self._run_flow(context, self._export_steps, period_start, period_end)
+    
+    def _run_flow(
+        self,
+        context: FlowContext,
+        steps: Callable[..., Any],
+        *args
+    ) -> FlowResult:
+        """
+        Gemensam ram för alla flöden: felhantering, FlowResult och bokföring.
+        
+        steps(context, evidence_ids, *args) gör flödets unika arbete,
+        lägger till evidence-ID:n allteftersom och returnerar output.
+        """
+        evidence_ids: List[str] = []
+        errors: List[str] = []
         
         try:
-            package = self.x_vault.export_regulator_package(
-                period_start=period_start,
-                period_end=period_end
-            )
-            
-            output = {
-                "package_id": package.package_id,
-                "evidence_count": len(package.evidence_objects),
-                "snapshot_count": len(package.snapshots),
-                "merkle_root": package.merkle_root,
-                "verification_instructions": package.verification_instructions
-            }
+            output = steps(context, evidence_ids, *args)
             success = True
-            
         except Exception as e:
             errors.append(str(e))
             output = None
@@ -362,36 +304,239 @@ class Orchestrator:
             success=success,
             output=output,
             evidence_ids=evidence_ids,
-            completed_at=datetime.now(timezone.utc).isoformat(),
+            completed_at=_now_iso(),
             errors=errors
         )
         
-        if context.flow_id in self.active_flows:
-            del self.active_flows[context.flow_id]
-        self.completed_flows.append(result)
+        # Flytta till completed
+        self._complete_flow(context, result)
         
         return result
     
+    # ==========================================================================
+    # FLÖDESSTEG (endast det unika arbetet per flöde)
+    # ==========================================================================
+    
+    def _witness_query_steps(
+        self,
+        context: FlowContext,
+        evidence_ids: List[str],
+        question: str,
+        role: str
+    ) -> Dict:
+        """Flöde C: query -> klassificering -> seal"""
+        # Steg 1: Skapa witness query
+        query = WitnessQuery(
+            query_id=str(uuid4()),
+            question=question,
+            scope=context.scope,
+            user_id=context.user_id,
+            role=role,
+            timestamp=_now_iso()
+        )
+        
+        # Steg 2: Exekvera query via witness AI
+        response = self.witness_ai.query(query)
+        
+        # Steg 3: Klassificera via status engine
+        status_result = self.status_engine.classify(
+            output=response.response,
+            sources=response.citations,
+            scope_documents=context.scope
+        )
+        
+        # Steg 4: Seal i X-Vault
+        evidence = self._seal(
+            evidence_type=EvidenceType.WITNESS_RESPONSE,
+            content={
+                "query": question,
+                "response": status_result.output,
+                "status": status_result.status.value,
+                "sources": response.citations,
+                "blocked_phrases": status_result.blocked_phrases
+            },
+            metadata={
+                "flow_id": context.flow_id,
+                "user_id": context.user_id,
+                "suite_id": context.suite_id
+            }
+        )
+        evidence_ids.append(evidence.evidence_id)
+        
+        return {
+            "response": status_result.output,
+            "status": status_result.status.value,
+            "sources": response.citations,
+            "hash": status_result.output_hash,
+            "disclaimer": response.disclaimer
+        }
+    
+    def _human_decision_steps(
+        self,
+        context: FlowContext,
+        evidence_ids: List[str],
+        decision_type: str,
+        decision_data: Dict,
+        approver_id: str,
+        approver_role: str
+    ) -> Dict:
+        """Flöde D: roll -> seal av beslut"""
+        # Steg 1: Skapa authorization request
+        # (Förenklad - i produktion hämtas user från identity provider)
+        approver = User(
+            user_id=approver_id,
+            name="",
+            email="",
+            role=Role[approver_role.upper()],
+            org_id=context.org_id,
+            active=True
+        )
+        
+        # Steg 2: Registrera beslut i X-Vault
+        evidence = self._seal(
+            evidence_type=EvidenceType.AUTHORIZATION_DECISION,
+            content={
+                "decision_type": decision_type,
+                "decision_data": decision_data,
+                "approver_id": approver_id,
+                "approver_role": approver_role,
+                "flow_id": context.flow_id
+            },
+            metadata={
+                "suite_id": context.suite_id,
+                "org_id": context.org_id
+            }
+        )
+        evidence_ids.append(evidence.evidence_id)
+        
+        return {
+            "decision_type": decision_type,
+            "status": "recorded",
+            "evidence_id": evidence.evidence_id,
+            "hash": evidence.content_hash
+        }
+    
+    def _export_steps(
+        self,
+        context: FlowContext,
+        evidence_ids: List[str],
+        period_start: str,
+        period_end: str
+    ) -> Dict:
+        """Flöde E: regulator package för perioden"""
+        with self._vault_lock:
+            package = self.x_vault.export_regulator_package(
+                period_start=period_start,
+                period_end=period_end
+            )
+        
+        return {
+            "package_id": package.package_id,
+            "evidence_count": len(package.evidence_objects),
+            "snapshot_count": len(package.snapshots),
+            "merkle_root": package.merkle_root,
+            "verification_instructions": package.verification_instructions
+        }
+    
+    # ==========================================================================
+    # ASYNKRONA VARIANTER
+    # Stegen inom ett flöde beror på varandra (seal hashar klassificerad output),
+    # så parallellismen sker mellan flöden: varje flöde körs i en worker-tråd
+    # och flera flöden kan vara i luften samtidigt via asyncio.gather.
+    # ==========================================================================
+    
+    async def execute_witness_query_async(
+        self,
+        context: FlowContext,
+        question: str,
+        role: str
+    ) -> FlowResult:
+        """Flöde C utan att blockera event-loopen"""
+        return await asyncio.to_thread(self.execute_witness_query, context, question, role)
+    
+    async def execute_human_decision_async(
+        self,
+        context: FlowContext,
+        decision_type: str,
+        decision_data: Dict,
+        approver_id: str,
+        approver_role: str
+    ) -> FlowResult:
+        """Flöde D utan att blockera event-loopen"""
+        return await asyncio.to_thread(
+            self.execute_human_decision,
+            context, decision_type, decision_data, approver_id, approver_role
+        )
+    
+    async def execute_export_async(
+        self,
+        context: FlowContext,
+        period_start: str,
+        period_end: str
+    ) -> FlowResult:
+        """Flöde E utan att blockera event-loopen"""
+        return await asyncio.to_thread(self.execute_export, context, period_start, period_end)
+    
+    def _seal(
+        self,
+        evidence_type: EvidenceType,
+        content: Dict,
+        metadata: Optional[Dict] = None
+    ):
+        """
+        Försegla evidence med group commit över samtidiga flöden.
+        
+        Varje anrop köar sin payload. Den tråd som först får _vault_lock
+        förseglar alla köade payloads i ett x_vault.seal_batch-anrop;
+        övriga trådar hittar sitt resultat redan ifyllt när de får låset.
+        """
+        slot = [(evidence_type, content, metadata), None, None]  # payload, evidence, fel
+        with self._seal_pending_lock:
+            self._seal_pending.append(slot)
+        
+        with self._vault_lock:
+            if slot[1] is None and slot[2] is None:
+                with self._seal_pending_lock:
+                    batch, self._seal_pending = self._seal_pending, []
+                try:
+                    sealed = self.x_vault.seal_batch([s[0] for s in batch])
+                    for s, evidence in zip(batch, sealed):
+                        s[1] = evidence
+                except Exception as e:
+                    for s in batch:
+                        s[2] = e
+        
+        if slot[2] is not None:
+            raise slot[2]
+        return slot[1]
+    
+    def _complete_flow(self, context: FlowContext, result: FlowResult):
+        """Flytta flöde från aktiva till historik och uppdatera räknare"""
+        self.active_flows.pop(context.flow_id, None)
+        with self._history_lock:
+            self.completed_flows.append(result)
+            self._total_count += 1
+            self._success_count += int(result.success)
+            self._flow_type_counts[context.flow_type.value] += 1
+    
     def get_active_flows(self) -> List[FlowContext]:
         """Hämta alla aktiva flöden"""
         return list(self.active_flows.values())
     
     def get_flow_history(self, limit: int = 100) -> List[FlowResult]:
         """Hämta flödeshistorik"""
-        return self.completed_flows[-limit:]
+        start = max(0, len(self.completed_flows) - limit)
+        return list(islice(self.completed_flows, start, None))
     
     def get_stats(self) -> Dict:
         """Hämta statistik"""
-        flow_counts = {}
-        for result in self.completed_flows:
-            flow_type = result.flow_id  # Simplified
-            flow_counts[flow_type] = flow_counts.get(flow_type, 0) + 1
-            
-        return {
-            "active_flows": len(self.active_flows),
-            "completed_flows": len(self.completed_flows),
-            "success_rate": (
-                sum(1 for r in self.completed_flows if r.success) / 
-                len(self.completed_flows) if self.completed_flows else 0
-            )
-        }
+        with self._history_lock:
+            return {
+                "active_flows": len(self.active_flows),
+                "completed_flows": self._total_count,
+                "flow_counts": dict(self._flow_type_counts),
+                "success_rate": (
+                    self._success_count / self._total_count
+                    if self._total_count else 0
+                )
+            }
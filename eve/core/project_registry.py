@@ -11,10 +11,18 @@ It does NOT run as a standalone service.
 """
 
 import json
+from collections import Counter
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from pydantic import BaseModel, Field
 
+# Optional: orjson for fast JSON parsing (falls back to stdlib json)
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 # ════════════════════════════════════════════════════════════════
 # CONFIGURATION
 # ════════════════════════════════════════════════════════════════
@@ -46,6 +54,18 @@ class ProjectListResponse(BaseModel):
 # ════════════════════════════════════════════════════════════════
 
 _cached_projects: Optional[List[Dict[str, Any]]] = None
+_project_index: Optional[Dict[str, Dict[str, Any]]] = None
+_cached_response: Optional[ProjectListResponse] = None
+_cached_response_json: Optional[bytes] = None
+
+
+def _reset_cache() -> None:
+    """Drop cached registry, id index and response models together (forces reload)."""
+    global _cached_projects, _project_index, _cached_response, _cached_response_json
+    _cached_projects = None
+    _project_index = None
+    _cached_response = None
+    _cached_response_json = None
 
 
 def load_projects() -> List[Dict[str, Any]]:
@@ -58,7 +78,7 @@ def load_projects() -> List[Dict[str, Any]]:
     - No duplicate project_ids
     - 'legacy' project exists
     """
-    global _cached_projects
+    global _cached_projects, _project_index
     
     if _cached_projects is not None:
         return _cached_projects
@@ -66,39 +86,56 @@ def load_projects() -> List[Dict[str, Any]]:
     if not PROJECTS_FILE.exists():
         raise RuntimeError(f"Projects file not found: {PROJECTS_FILE}")
     
-    with open(PROJECTS_FILE, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = _loads(PROJECTS_FILE.read_bytes())
     
     if not isinstance(data, list):
         raise RuntimeError("projects.json must be a JSON array")
     
     # Validate no duplicates
-    ids = [p.get("project_id") for p in data]
-    duplicates = [pid for pid in ids if ids.count(pid) > 1]
+    counts = Counter(p.get("project_id") for p in data)
+    duplicates = [pid for pid, count in counts.items() if count > 1]
     if duplicates:
         raise RuntimeError(f"Duplicate project_id(s): {set(duplicates)}")
     
     # Validate legacy exists
-    if "legacy" not in ids:
+    if "legacy" not in counts:
         raise RuntimeError("'legacy' project is required but missing")
     
+    _project_index = {p.get("project_id"): p for p in data}
     _cached_projects = data
     return _cached_projects
 
 
 def get_project_metadata(project_id: str) -> Optional[Dict[str, Any]]:
     """Get a single project by ID."""
-    projects = load_projects()
-    for p in projects:
-        if p.get("project_id") == project_id:
-            return p
-    return None
+    load_projects()
+    return _project_index.get(project_id)
 
 
 def list_all_projects() -> ProjectListResponse:
-    """Get all projects as response model."""
+    """
+    Get all projects as response model.
+    
+    The registry is immutable once loaded, so the validated model is
+    built once and reused until _reset_cache().
+    """
+    global _cached_response
+    
+    if _cached_response is not None:
+        return _cached_response
+    
     projects = load_projects()
-    return ProjectListResponse(
+    _cached_response = ProjectListResponse(
         projects=[ProjectMetadata(**p) for p in projects],
         count=len(projects)
     )
+    return _cached_response
+
+
+def list_all_projects_json() -> bytes:
+    """Get all projects as pre-serialized JSON (for the /api/projects endpoint)."""
+    global _cached_response_json
+    
+    if _cached_response_json is None:
+        _cached_response_json = list_all_projects().model_dump_json().encode("utf-8")
+    return _cached_response_json
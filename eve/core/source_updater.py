@@ -14,17 +14,35 @@ PRINCIPER:
 Patent-referens: EVE Witness Mode Architecture
 """
 
+import asyncio
 import json
 import hashlib
+import os
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Tuple, Union
+from dataclasses import dataclass, asdict, field
 from enum import Enum
 import urllib.request
 import urllib.error
-import xml.etree.ElementTree as ET
+
+# Optional: orjson for fast JSON parsing/encoding (falls back to stdlib json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional: ijson for streaming a few keys out of large article files
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
 
 
 # ============================================================
@@ -37,6 +55,125 @@ KNOWLEDGE_PATH = BASE_PATH / "knowledge" / "documents"
 PENDING_PATH = BASE_PATH / "knowledge" / "pending"
 ARCHIVE_PATH = BASE_PATH / "knowledge" / "archive"
 
+# Max concurrent article fetches against one source (be polite to EUR-Lex)
+MAX_FETCH_CONCURRENCY = 20
+
+
+def _loads(data: bytes):
+    """Parse JSON bytes (orjson if available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps_pretty(obj) -> bytes:
+    """Encode to indented UTF-8 JSON, byte-identical to json.dumps(indent=2, ensure_ascii=False)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _dumps_compact(obj) -> bytes:
+    """Encode to compact UTF-8 JSON (archive tier: no indentation)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+    return (json.dumps(obj, ensure_ascii=False, separators=(',', ':')) + "\n").encode('utf-8')
+
+
+def _write_file(path: Path, data: bytes):
+    """
+    Write bytes to path, creating the parent directory only if it is missing.
+    
+    Bulk fetch/approve writes many files into a handful of directories; trying
+    the write first skips a mkdir per file once the directory exists.
+    """
+    try:
+        path.write_bytes(data)
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+
+
+def _write_archive(path: Path, obj):
+    """
+    Write an archived/rejected article compactly.
+    
+    Archived files are write-once and never edited by hand, so they are stored
+    as plain JSON without indentation; any JSON reader still opens them.
+    """
+    _write_file(path, _dumps_compact(obj))
+
+
+def _load_keys(path: str, keys: Tuple[str, ...]) -> Dict:
+    """
+    Read only the given top-level keys from a JSON object file.
+    
+    With ijson the file is streamed and parsing stops once every key has been
+    seen; otherwise the whole file is parsed.
+    """
+    if not IJSON_AVAILABLE:
+        with open(path, 'rb') as f:
+            data = _loads(f.read())
+        return {key: data.get(key) for key in keys}
+    
+    wanted = set(keys)
+    found = {}
+    with open(path, 'rb') as f:
+        for key, value in ijson.kvitems(f, ''):
+            if key in wanted:
+                found[key] = value
+                if len(found) == len(wanted):
+                    break
+    return {key: found.get(key) for key in keys}
+
+
+def _iter_json(directory: Path, prefix: str = ""):
+    """Yield DirEntry objects for prefix*.json files in directory (none if missing)."""
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                name = entry.name
+                if name.startswith(prefix) and name.endswith(".json") and entry.is_file():
+                    yield entry
+    except FileNotFoundError:
+        return
+
+
+# (directory, prefix) -> (directory mtime_ns, json file count)
+_count_cache: Dict[Tuple[str, str], Tuple[int, int]] = {}
+
+# Directories modified more recently than this are rescanned (coarse mtime clocks)
+_RACY_MTIME_NS = 2_000_000_000
+
+
+def _count_json(directory: Path, prefix: str = "") -> int:
+    """
+    Count prefix*.json files in directory, cached on the directory's mtime.
+    
+    Adding, removing or renaming an entry bumps the directory mtime, so a
+    repeated call on an unchanged directory costs one stat instead of a scan.
+    """
+    try:
+        mtime = os.stat(directory).st_mtime_ns
+    except FileNotFoundError:
+        return 0
+    
+    key = (str(directory), prefix)
+    cached = _count_cache.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    
+    count = sum(1 for _ in _iter_json(directory, prefix))
+    if time.time_ns() - mtime > _RACY_MTIME_NS:
+        _count_cache[key] = (mtime, count)
+    return count
+
+
+@lru_cache(maxsize=4096)
+def _article_path(regulation: str, article_num: int) -> Path:
+    """Published article path (memoized; the same articles are checked on every fetch)."""
+    return KNOWLEDGE_PATH / "eu" / regulation / "articles" / f"article_{article_num}.json"
+
 
 class TrustLevel(Enum):
     AUTHORITATIVE = "AUTHORITATIVE"  # EUR-Lex, ISO, Government
@@ -52,7 +189,7 @@ class UpdateStatus(Enum):
     PENDING_APPROVAL = "PENDING_APPROVAL"  # Awaiting human review
 
 
-@dataclass
+@dataclass(slots=True)
 class Article:
     """Knowledge article with full provenance."""
     id: str
@@ -70,19 +207,19 @@ class Article:
     approved_by: Optional[str] = None
     approved_date: Optional[str] = None
     x_vault_hash: Optional[str] = None
-    cross_references: List[str] = None
+    cross_references: List[str] = field(default_factory=list)
     effective_date: Optional[str] = None
     language: str = "en"
     
     def to_json(self) -> str:
-        return json.dumps(asdict(self), indent=2, ensure_ascii=False)
+        return _dumps_pretty(asdict(self)).decode('utf-8')
     
     @classmethod
     def from_json(cls, data: dict) -> 'Article':
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class UpdateResult:
     """Result of an update operation."""
     regulation: str
@@ -115,10 +252,15 @@ class SourceUpdater:
         self.config = self._load_config()
         self._ensure_directories()
     
+    @cached_property
+    def _reg_index(self) -> Dict:
+        """EUR-Lex regulation configs keyed by regulation id."""
+        return self.config["sources"]["eur_lex"]["regulations"]
+    
     def _load_config(self) -> dict:
         """Load trusted sources configuration."""
         if CONFIG_PATH.exists():
-            return json.loads(CONFIG_PATH.read_text(encoding='utf-8'))
+            return _loads(CONFIG_PATH.read_bytes())
         raise FileNotFoundError(f"Config not found: {CONFIG_PATH}")
     
     def _ensure_directories(self):
@@ -127,9 +269,11 @@ class SourceUpdater:
         PENDING_PATH.mkdir(parents=True, exist_ok=True)
         ARCHIVE_PATH.mkdir(parents=True, exist_ok=True)
     
-    def _compute_hash(self, content: str) -> str:
-        """SHA-256 hash of content."""
-        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+    def _compute_hash(self, content: Union[str, bytes]) -> str:
+        """SHA-256 hash of content (raw source bytes are hashed without decoding)."""
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        return hashlib.sha256(content).hexdigest()
     
     def _get_timestamp(self) -> str:
         """ISO timestamp."""
@@ -145,7 +289,7 @@ class SourceUpdater:
         
         EUR-Lex REST API: https://eur-lex.europa.eu/eurlex-ws/
         """
-        reg_config = self.config["sources"]["eur_lex"]["regulations"].get(regulation)
+        reg_config = self._reg_index.get(regulation)
         if not reg_config:
             raise ValueError(f"Unknown regulation: {regulation}")
         
@@ -186,23 +330,78 @@ class SourceUpdater:
     
     def fetch_regulation(self, regulation: str, articles: List[int] = None) -> List[UpdateResult]:
         """
-        Fetch all articles for a regulation.
+        Fetch all articles for a regulation (sync entrypoint for CLI callers).
+        
+        Fetches run on a thread pool with no event loop, so this is safe to call
+        from any thread; code already inside an event loop should await
+        fetch_regulation_async instead of blocking it.
         
         Args:
             regulation: e.g., 'gdpr', 'ai_act', 'dora'
             articles: Specific articles to fetch, or None for all
         """
-        reg_config = self.config["sources"]["eur_lex"]["regulations"].get(regulation)
-        if not reg_config:
-            raise ValueError(f"Unknown regulation: {regulation}")
+        articles_to_fetch = self._articles_to_fetch(regulation, articles)
+        if not articles_to_fetch:
+            return []
+        
+        workers = min(MAX_FETCH_CONCURRENCY, len(articles_to_fetch))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self._fetch_and_compare, regulation, art_num)
+                for art_num in articles_to_fetch
+            ]
+            outcomes = []
+            for future in futures:
+                try:
+                    outcomes.append(future.result())
+                except Exception as e:
+                    outcomes.append(e)
+        
+        return self._collect_results(regulation, articles_to_fetch, outcomes)
+    
+    async def fetch_regulation_async(self, regulation: str, articles: List[int] = None) -> List[UpdateResult]:
+        """
+        Fetch all articles for a regulation concurrently.
+        
+        Each article is fetched and compared in a worker thread, so network
+        round-trips overlap instead of running back to back. At most
+        MAX_FETCH_CONCURRENCY requests are in flight at once. A failure for one
+        article becomes an ERROR result and does not abort the others.
+        """
+        articles_to_fetch = self._articles_to_fetch(regulation, articles)
+        
+        semaphore = asyncio.Semaphore(MAX_FETCH_CONCURRENCY)
         
-        total_articles = reg_config["articles"]
-        articles_to_fetch = articles or list(range(1, total_articles + 1))
+        async def fetch_one(art_num: int) -> UpdateResult:
+            async with semaphore:
+                return await asyncio.to_thread(self._fetch_and_compare, regulation, art_num)
         
+        outcomes = await asyncio.gather(
+            *[fetch_one(art_num) for art_num in articles_to_fetch],
+            return_exceptions=True
+        )
+        
+        return self._collect_results(regulation, articles_to_fetch, outcomes)
+    
+    def _articles_to_fetch(self, regulation: str, articles: Optional[List[int]]) -> List[int]:
+        """Requested article numbers, or every article of the regulation."""
+        reg_config = self._reg_index.get(regulation)
+        if not reg_config:
+            raise ValueError(f"Unknown regulation: {regulation}")
+        return articles or list(range(1, reg_config["articles"] + 1))
+    
+    def _collect_results(self, regulation: str, articles_to_fetch: List[int], outcomes: List) -> List[UpdateResult]:
+        """Turn per-article outcomes into results; an exception becomes an ERROR result."""
         results = []
-        for art_num in articles_to_fetch:
-            result = self._fetch_and_compare(regulation, art_num)
-            results.append(result)
+        for art_num, outcome in zip(articles_to_fetch, outcomes):
+            if isinstance(outcome, Exception):
+                outcome = UpdateResult(
+                    regulation=regulation,
+                    article_number=str(art_num),
+                    status=UpdateStatus.ERROR,
+                    message=f"Fetch failed: {outcome}"
+                )
+            results.append(outcome)
         
         return results
     
@@ -213,7 +412,7 @@ class SourceUpdater:
         existing_path = self._get_article_path(regulation, article_num)
         existing = None
         if existing_path.exists():
-            existing = json.loads(existing_path.read_text(encoding='utf-8'))
+            existing = _loads(existing_path.read_bytes())
         
         # Fetch new
         new_article = self.fetch_eurlex_article(regulation, article_num)
@@ -257,15 +456,13 @@ class SourceUpdater:
     
     def _get_article_path(self, regulation: str, article_num: int) -> Path:
         """Get path for an article."""
-        return KNOWLEDGE_PATH / "eu" / regulation / "articles" / f"article_{article_num}.json"
+        return _article_path(regulation, article_num)
     
     def _save_to_pending(self, article: Article):
         """Save article to pending directory for approval."""
         pending_dir = PENDING_PATH / article.regulation.lower()
-        pending_dir.mkdir(parents=True, exist_ok=True)
-        
         path = pending_dir / f"article_{article.article_number}_{self._get_timestamp()[:10]}.json"
-        path.write_text(article.to_json(), encoding='utf-8')
+        _write_file(path, _dumps_pretty(asdict(article)))
     
     # ============================================================
     # APPROVAL WORKFLOW
@@ -275,12 +472,14 @@ class SourceUpdater:
         """List all articles pending approval."""
         pending = []
         
-        for reg_dir in PENDING_PATH.iterdir():
-            if reg_dir.is_dir():
-                for article_file in reg_dir.glob("*.json"):
-                    data = json.loads(article_file.read_text(encoding='utf-8'))
+        with os.scandir(PENDING_PATH) as reg_dirs:
+            for reg_dir in reg_dirs:
+                if not reg_dir.is_dir():
+                    continue
+                for entry in _iter_json(Path(reg_dir.path)):
+                    data = _load_keys(entry.path, ("regulation", "article_number", "fetched_date"))
                     pending.append({
-                        "file": str(article_file),
+                        "file": entry.path,
                         "regulation": data.get("regulation"),
                         "article": data.get("article_number"),
                         "fetched": data.get("fetched_date")
@@ -304,7 +503,7 @@ class SourceUpdater:
             raise FileNotFoundError(f"Pending file not found: {pending_file}")
         
         # Load article
-        data = json.loads(pending_path.read_text(encoding='utf-8'))
+        data = _loads(pending_path.read_bytes())
         
         # Add approval
         timestamp = self._get_timestamp()
@@ -314,15 +513,14 @@ class SourceUpdater:
         
         # Determine target path
         target_dir = KNOWLEDGE_PATH / "eu" / data["regulation"].lower() / "articles"
-        target_dir.mkdir(parents=True, exist_ok=True)
         target_path = target_dir / f"article_{data['article_number']}.json"
         
         # Archive existing if present
         if target_path.exists():
-            self._archive_article(target_path)
+            self._archive_article(target_path, timestamp, data["regulation"], data["article_number"])
         
         # Write approved version
-        target_path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding='utf-8')
+        _write_file(target_path, _dumps_pretty(data))
         
         # Remove from pending
         pending_path.unlink()
@@ -341,17 +539,32 @@ class SourceUpdater:
         
         return evidence
     
-    def _archive_article(self, article_path: Path):
-        """Archive previous version of article."""
-        data = json.loads(article_path.read_text(encoding='utf-8'))
+    def _archive_article(
+        self,
+        article_path: Path,
+        timestamp: Optional[str] = None,
+        regulation: Optional[str] = None,
+        article_number: Optional[str] = None
+    ):
+        """
+        Archive previous version of article (timestamp: the calling operation's, if any).
         
-        archive_dir = ARCHIVE_PATH / data["regulation"].lower()
-        archive_dir.mkdir(parents=True, exist_ok=True)
+        Callers that already know the regulation and article number pass them in,
+        so the old version is moved as-is with os.replace, without parsing.
+        """
+        if regulation is None or article_number is None:
+            keys = _load_keys(str(article_path), ("regulation", "article_number"))
+            regulation, article_number = keys["regulation"], keys["article_number"]
         
-        timestamp = self._get_timestamp()[:10]
-        archive_path = archive_dir / f"article_{data['article_number']}_{timestamp}.json"
+        archive_dir = ARCHIVE_PATH / regulation.lower()
+        date = (timestamp or self._get_timestamp())[:10]
+        archive_path = archive_dir / f"article_{article_number}_{date}.json"
         
-        article_path.rename(archive_path)
+        try:
+            os.replace(article_path, archive_path)
+        except FileNotFoundError:
+            archive_dir.mkdir(parents=True, exist_ok=True)
+            os.replace(article_path, archive_path)
     
     def reject_article(self, pending_file: str, rejected_by: str, reason: str) -> Dict:
         """Reject a pending article."""
@@ -359,18 +572,18 @@ class SourceUpdater:
         if not pending_path.exists():
             raise FileNotFoundError(f"Pending file not found: {pending_file}")
         
-        data = json.loads(pending_path.read_text(encoding='utf-8'))
+        data = _loads(pending_path.read_bytes())
         
         # Move to rejected archive
         rejected_dir = ARCHIVE_PATH / "rejected" / data["regulation"].lower()
-        rejected_dir.mkdir(parents=True, exist_ok=True)
         
+        timestamp = self._get_timestamp()
         data["rejected_by"] = rejected_by
-        data["rejected_date"] = self._get_timestamp()
+        data["rejected_date"] = timestamp
         data["rejection_reason"] = reason
         
-        rejected_path = rejected_dir / f"article_{data['article_number']}_{self._get_timestamp()[:10]}.json"
-        rejected_path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding='utf-8')
+        rejected_path = rejected_dir / f"article_{data['article_number']}_{timestamp[:10]}.json"
+        _write_archive(rejected_path, data)
         
         pending_path.unlink()
         
@@ -390,16 +603,16 @@ class SourceUpdater:
         """Get coverage report for all regulations."""
         report = {}
         
-        for reg_key, reg_config in self.config["sources"]["eur_lex"]["regulations"].items():
+        for reg_key, reg_config in self._reg_index.items():
             total = reg_config["articles"]
             
             # Count existing
             reg_path = KNOWLEDGE_PATH / "eu" / reg_key / "articles"
-            existing = len(list(reg_path.glob("article_*.json"))) if reg_path.exists() else 0
+            existing = _count_json(reg_path, "article_")
             
             # Count pending
             pending_path = PENDING_PATH / reg_key
-            pending = len(list(pending_path.glob("*.json"))) if pending_path.exists() else 0
+            pending = _count_json(pending_path)
             
             report[reg_key] = {
                 "name": reg_config["short_name"],
@@ -7,13 +7,59 @@ Garanterar att witness-mode alltid följs.
 Patent-referens: Krav 6 - "blockera output som innehåller rekommendationsfraser"
 """
 
+import functools
 import hashlib
 import json
 import re
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
+
+# Valfritt: pyahocorasick för frasskanning i ett pass (faller tillbaka på regex)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+def _build_phrase_automaton(phrases: List[str]):
+    """Aho-Corasick-automat över fraserna (värde = index i listan), eller None"""
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    automaton = ahocorasick.Automaton()
+    for index, phrase in enumerate(phrases):
+        automaton.add_word(phrase.lower(), index)
+    automaton.make_automaton()
+    return automaton
+
+
+# Svenska indikatorord för språkdetektering (hela ord)
+_SWEDISH_WORDS = frozenset({'jag', 'vi', 'vad', 'hur', 'bör', 'ska', 'måste', 'är', 'det'})
+_WORD_RE = re.compile(r"\w+")
+
+
+# Förankrade ordprefix, t.ex. r"^bör\s+jag\b" -> ("bör", "jag")
+_ANCHORED_PATTERN_RE = re.compile(r"^\^(\w+(?:\\s\+\w+)*)\\b$")
+_LEADING_WORD_RE = re.compile(r"\w*")
+
+
+def _anchored_words(pattern: str) -> Optional[Tuple[str, ...]]:
+    """Ordtupel för ett rent förankrat ordprefix-pattern, annars None"""
+    match = _ANCHORED_PATTERN_RE.match(pattern)
+    if not match:
+        return None
+    return tuple(match.group(1).lower().split("\\s+"))
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_scope(patterns: Tuple[str, ...]) -> Tuple[Tuple[bool, str], ...]:
+    """Förkompilera scope-patterns till (är_prefix, sträng) en gång per scope"""
+    return tuple(
+        (True, p[:-2]) if p.endswith('**') else (False, p)
+        for p in patterns
+    )
 
 
 class OutputStatus(Enum):
@@ -24,7 +70,7 @@ class OutputStatus(Enum):
     DOMAIN_BOUNDARY = "DOMAIN_BOUNDARY"
 
 
-@dataclass
+@dataclass(slots=True)
 class StatusResult:
     """Resultat från status-klassificering"""
     status: OutputStatus
@@ -39,9 +85,29 @@ class StatusResult:
     confidence: float
     
     def to_dict(self) -> Dict:
-        result = asdict(self)
-        result['status'] = self.status.value
-        return result
+        # Platt dict utan asdict():s djupkopiering av sources
+        return {
+            'status': self.status.value,
+            'output': self.output,
+            'original_output': self.original_output,
+            'sources': self.sources,
+            'blocked_phrases': self.blocked_phrases,
+            'blocked_intent': self.blocked_intent,
+            'output_hash': self.output_hash,
+            'timestamp': self.timestamp,
+            'domain': self.domain,
+            'confidence': self.confidence
+        }
+    
+    def to_header_dict(self) -> Dict:
+        """Endast status, hash och tid - för audit-loggning utan output/källor"""
+        return {
+            'status': self.status.value,
+            'output_hash': self.output_hash,
+            'timestamp': self.timestamp,
+            'domain': self.domain,
+            'confidence': self.confidence
+        }
 
 
 class StatusEngine:
@@ -115,6 +181,24 @@ class StatusEngine:
         r"\bråda\b",
     ]
     
+    # Förankrade ordprefix ("^bör\s+jag\b") slås upp som ordtupler i ett set;
+    # övriga patterns körs som en alternation. Tillsammans avgör de om frågan
+    # blockeras. Individuellt kompilerade patterns används bara för att
+    # rapportera vilket pattern (i listans ordning) som träffade.
+    _ANCHORED_PREFIXES = frozenset(
+        w for w in (_anchored_words(p) for p in FORBIDDEN_QUESTION_PATTERNS) if w
+    )
+    _ANCHORED_MAX_WORDS = max(len(w) for w in _ANCHORED_PREFIXES)
+    _INTENT_RE = re.compile(
+        "|".join(
+            f"(?:{p})" for p in FORBIDDEN_QUESTION_PATTERNS if _anchored_words(p) is None
+        ),
+        re.IGNORECASE
+    )
+    _COMPILED_QUESTION_PATTERNS = [
+        (p, re.compile(p, re.IGNORECASE)) for p in FORBIDDEN_QUESTION_PATTERNS
+    ]
+    
     # ==========================================================================
     # FÖRBJUDNA OUTPUT-FRASER
     # ==========================================================================
@@ -141,6 +225,17 @@ class StatusEngine:
         "compliance status:",
     ]
     
+    # Förkompilerad skanning: automaten hittar alla (även överlappande) fraser
+    # i ett pass; alternationen räcker för att avgöra om en mening ska bort
+    _PHRASES_LOWER = [p.lower() for p in FORBIDDEN_PHRASES]
+    _PHRASE_RE = re.compile("|".join(re.escape(p) for p in _PHRASES_LOWER))
+    _PHRASE_AUTOMATON = _build_phrase_automaton(FORBIDDEN_PHRASES)
+    _MIN_PHRASE_LEN = min(len(p) for p in FORBIDDEN_PHRASES)
+    
+    # Meningsgräns = . ! ? följt av blanksteg; separatorn fångas så att
+    # radbrytningar mellan stycken bevaras (och "3.14" inte delas)
+    _SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])(\s+)')
+    
     # ==========================================================================
     # WITNESS-MODE REDIRECT RESPONSES
     # ==========================================================================
@@ -193,6 +288,9 @@ Exempel:
         blocked_phrases = []
         blocked_intent = None
         
+        # En tidsstämpel per klassificering: samma värde hashas och returneras
+        timestamp = datetime.now(timezone.utc).isoformat()
+        
         # =======================================================
         # STEG 0: KLASSIFICERA INPUT-INTENT
         # =======================================================
@@ -216,8 +314,8 @@ Exempel:
                     sources=[],
                     blocked_phrases=[],
                     blocked_intent=blocked_intent,
-                    output_hash=self._generate_hash(redirect, []),
-                    timestamp=datetime.now(timezone.utc).isoformat(),
+                    output_hash=self._generate_hash(redirect, [], timestamp),
+                    timestamp=timestamp,
                     domain=self.domain,
                     confidence=1.0
                 )
@@ -254,7 +352,7 @@ Exempel:
         # =======================================================
         # STEG 4: GENERERA HASH
         # =======================================================
-        output_hash = self._generate_hash(output, sources)
+        output_hash = self._generate_hash(output, sources, timestamp)
         
         return StatusResult(
             status=status,
@@ -264,7 +362,7 @@ Exempel:
             blocked_phrases=blocked_phrases,
             blocked_intent=blocked_intent,
             output_hash=output_hash,
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=timestamp,
             domain=self.domain,
             confidence=confidence
         )
@@ -277,29 +375,50 @@ Exempel:
         """
         question_clean = question.strip()
         
-        for pattern in self.FORBIDDEN_QUESTION_PATTERNS:
-            # Använd IGNORECASE för att matcha oavsett case
-            match = re.search(pattern, question_clean, re.IGNORECASE)
-            if match:
+        # Snabb väg: de flesta frågor träffar inget pattern
+        if not (
+            self._has_anchored_prefix(question_clean)
+            or self._INTENT_RE.search(question_clean)
+        ):
+            return False, None
+        
+        for pattern, compiled in self._COMPILED_QUESTION_PATTERNS:
+            if compiled.search(question_clean):
                 return True, pattern
                 
         return False, None
     
+    def _has_anchored_prefix(self, question: str) -> bool:
+        """Börjar frågan med något av de förankrade ordprefixen?"""
+        words = question.lower().split(None, self._ANCHORED_MAX_WORDS)
+        for n in range(1, min(len(words), self._ANCHORED_MAX_WORDS) + 1):
+            # Sista ordet följs av \b i pattern: jämför bara dess inledande \w-del
+            last = _LEADING_WORD_RE.match(words[n - 1]).group()
+            if (*words[:n - 1], last) in self._ANCHORED_PREFIXES:
+                return True
+        return False
+    
     def _is_swedish(self, text: str) -> bool:
-        """Enkel språkdetektering"""
-        swedish_indicators = ['jag', 'vi', 'vad', 'hur', 'bör', 'ska', 'måste', 'är', 'det']
-        text_lower = text.lower()
-        swedish_count = sum(1 for word in swedish_indicators if word in text_lower)
-        return swedish_count >= 2
+        """Enkel språkdetektering (minst två svenska indikatorord)"""
+        words = set(_WORD_RE.findall(text.lower()))
+        return len(words & _SWEDISH_WORDS) >= 2
     
     def _block_recommendations(self, text: str) -> Tuple[str, List[str]]:
         """Blockera och ersätt rekommendationsfraser"""
-        blocked = []
-        modified_text = text.lower()
+        if len(text) < self._MIN_PHRASE_LEN:
+            return text, []
+        
+        lowered = text.lower()
         
-        for phrase in self.FORBIDDEN_PHRASES:
-            if phrase.lower() in modified_text:
-                blocked.append(phrase)
+        if self._PHRASE_AUTOMATON is not None:
+            hits = {index for _, index in self._PHRASE_AUTOMATON.iter(lowered)}
+            blocked = [self.FORBIDDEN_PHRASES[i] for i in sorted(hits)]
+        else:
+            blocked = [
+                phrase
+                for phrase, phrase_lower in zip(self.FORBIDDEN_PHRASES, self._PHRASES_LOWER)
+                if phrase_lower in lowered
+            ]
                 
         if blocked:
             replacement = (
@@ -307,19 +426,18 @@ Exempel:
                 "Only facts and citations from approved sources are shown.]\n\n"
             )
             
-            sentences = text.split('.')
-            filtered = []
-            for sentence in sentences:
-                contains_forbidden = any(
-                    phrase.lower() in sentence.lower() 
-                    for phrase in self.FORBIDDEN_PHRASES
-                )
-                if not contains_forbidden:
-                    filtered.append(sentence)
+            # parts = [mening, separator, mening, separator, ..., mening]
+            parts = self._SENTENCE_SPLIT_RE.split(text)
+            kept = []
+            for i in range(0, len(parts), 2):
+                if self._PHRASE_RE.search(parts[i].lower()):
+                    continue
+                kept.append(parts[i])
+                if i + 1 < len(parts):
+                    kept.append(parts[i + 1])
                     
-            text = '.'.join(filtered)
-            if blocked:
-                text += replacement
+            text = ''.join(kept)
+            text += replacement
                 
         return text, blocked
     
@@ -330,13 +448,14 @@ Exempel:
     ) -> Tuple[bool, List[str]]:
         """Verifiera att alla källor är inom scope"""
         issues = []
+        compiled = _compile_scope(tuple(scope_documents))
         
         for source in sources:
             doc_id = source.get('doc_id', '')
             
             in_scope = any(
-                self._match_scope(doc_id, scope_pattern)
-                for scope_pattern in scope_documents
+                doc_id.startswith(pattern) if is_prefix else doc_id == pattern
+                for is_prefix, pattern in compiled
             )
             
             if not in_scope:
@@ -354,15 +473,20 @@ Exempel:
             return doc_id.startswith(prefix)
         return doc_id == pattern
     
-    def _generate_hash(self, output: str, sources: List[Dict]) -> str:
-        """Generera SHA-256 hash av output + källor"""
-        data = {
-            'output': output,
-            'sources': sources,
-            'timestamp': datetime.now(timezone.utc).isoformat()
-        }
-        content = json.dumps(data, sort_keys=True, ensure_ascii=False)
-        return hashlib.sha256(content.encode()).hexdigest()
+    def _generate_hash(self, output: str, sources: List[Dict], timestamp: str) -> str:
+        """Generera SHA-256 hash av output + källor + tidsstämpel"""
+        # Matas bit för bit med samma separatorer (", " och ": ") som
+        # json.dumps({'output', 'sources', 'timestamp'}, sort_keys=True,
+        # ensure_ascii=False) - identiska bytes, utan att bygga hela strängen
+        dumps = lambda v: json.dumps(v, sort_keys=True, ensure_ascii=False).encode()
+        h = hashlib.sha256(b'{"output": ')
+        h.update(dumps(output))
+        h.update(b', "sources": ')
+        h.update(dumps(sources))
+        h.update(b', "timestamp": ')
+        h.update(dumps(timestamp))
+        h.update(b'}')
+        return h.hexdigest()
     
     def get_stats(self) -> Dict:
         """Returnera statistik"""
@@ -49,22 +49,44 @@ This API:
 ═══════════════════════════════════════════════════════════════════════════════
 """
 
+import asyncio
+import atexit
+import contextlib
 import json
 import hashlib
 import re
+import threading
+import time
+from bisect import bisect_right
+from collections import Counter, OrderedDict
+from itertools import islice
 from pathlib import Path
-from datetime import datetime, timezone
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, Iterator, TypedDict
 from enum import Enum
 
-from fastapi import FastAPI, HTTPException
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 import uvicorn
 
+# Optional: orjson for fast DB load/save (falls back to stdlib json)
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps_db = lambda obj: orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    _dumps_compact = orjson.dumps
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+except ImportError:
+    _loads = json.loads
+    _dumps_db = lambda obj: json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    _dumps_compact = lambda obj: json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    from fastapi.responses import JSONResponse as DefaultResponse
+
 # Project Registry (read-only metadata)
 try:
-    from project_registry import list_all_projects, get_project_metadata, ProjectMetadata, ProjectListResponse
+    from project_registry import list_all_projects_json, get_project_metadata, ProjectMetadata, ProjectListResponse
     PROJECT_REGISTRY_AVAILABLE = True
 except ImportError:
     PROJECT_REGISTRY_AVAILABLE = False
@@ -79,6 +101,25 @@ DB_PATH.parent.mkdir(parents=True, exist_ok=True)
 
 TRINITY_VERSION = "1.1.0"
 
+# Last formatted UTC second: (epoch_second, "YYYY-MM-DDTHH:MM:SS")
+_iso_second = (None, "")
+
+
+def _utc_now_iso() -> str:
+    """Current UTC time as ISO 8601 with microseconds (the seconds part is formatted once per second)."""
+    global _iso_second
+    sec, rem = divmod(time.time_ns(), 1_000_000_000)
+    cached_sec, prefix = _iso_second
+    if cached_sec != sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _iso_second = (sec, prefix)
+    return f"{prefix}.{rem // 1000:06d}+00:00"
+
+
+# ECL patterns (compiled once)
+EDI_REGEX = re.compile(r"^EVE-\d{4}-\d{6}$")
+USE_CASE_VALUE_REGEX = re.compile(r'"([^"]+)"|(.+)')
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # PROJECT ID NORMALIZATION (v2)
@@ -191,6 +232,17 @@ VALIDATION_RULES = {
     },
 }
 
+# Rules are locked, so their hash is computed once. Decision hashes keep the
+# stdlib json encoding: they are stored and shared with the MCP server.
+RULES_HASH = hashlib.sha256(json.dumps(VALIDATION_RULES, sort_keys=True, default=str).encode()).hexdigest()[:8]
+RULE_SET_VERSION = f"eve-ruleset-v1.0-{RULES_HASH}"
+
+# Per-command artifact prefixes upper-cased once: (prefix, PREFIX, min_count)
+ARTIFACT_PREFIXES = {
+    cmd: [(prefix, prefix.upper(), min_count) for prefix, min_count in rules["required_artifacts"]]
+    for cmd, rules in VALIDATION_RULES.items()
+}
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # PYDANTIC MODELS
@@ -202,11 +254,11 @@ class ECLRequest(BaseModel):
 
 
 class VerifyRequest(BaseModel):
-    eve_decision_id: str = Field(..., pattern=r"^EVE-\d{4}-\d{6}$")
+    eve_decision_id: str = Field(..., pattern=EDI_REGEX.pattern)
 
 
 class ReplayRequest(BaseModel):
-    eve_decision_id: str = Field(..., pattern=r"^EVE-\d{4}-\d{6}$")
+    eve_decision_id: str = Field(..., pattern=EDI_REGEX.pattern)
 
 
 class CreateArtifactRequest(BaseModel):
@@ -225,69 +277,203 @@ class ProposeArtifactRequest(BaseModel):
 class Database:
     def __init__(self, db_path: Path = DB_PATH):
         self.db_path = db_path
+        self._dirty = False
+        self._batch_depth = 0
+        self._lock = threading.RLock()
+        # Group commit: each commit gets a sequence number; one snapshot save
+        # covers every commit numbered up to the point it serialized the state
+        self._sync_lock = threading.Lock()
+        self._commit_seq = 0
+        self._saved_seq = 0
+        # Per-collection change counters behind the list ETags; the start time
+        # keeps tags from before a restart from matching again
+        self._etag_base = f"{time.time_ns():x}"
+        self._epochs: Counter = Counter()
         self.state = self._load()
+        self.state.setdefault("approvals", [])
+        self._build_indexes()
+        atexit.register(self._close)
+    
+    def _build_indexes(self):
+        # First entry per ID wins, matching the previous linear scans
+        self._decisions_by_id: Dict[str, Dict] = {}
+        self._vault_by_id: Dict[str, Dict] = {}
+        self._artifacts_by_id: Dict[str, Dict] = {}
+        for d in self.state["decisions"]:
+            self._decisions_by_id.setdefault(d["eve_decision_id"], d)
+        for v in self.state["vault"]:
+            self._vault_by_id.setdefault(v["eve_decision_id"], v)
+        for a in self.state["artifacts"]:
+            self._artifacts_by_id.setdefault(a["artifact_id"], a)
+        self._artifact_status_counts = Counter(a["status"] for a in self.state["artifacts"])
+        # (type, id) -> list position; a replaced record takes over its predecessor's
+        # slot, so positions never move
+        self._approval_pos_by_key: Dict[tuple, int] = {}
+        # List positions per type, ascending
+        self._approval_rows_by_type: Dict[str, List[int]] = {}
+        for i, a in enumerate(self.state["approvals"]):
+            # A loaded record holds its own copy of every string; type/status
+            # only take a handful of values, so share one object each
+            a["type"] = sys.intern(a["type"])
+            a["status"] = sys.intern(a["status"])
+            self._approval_pos_by_key.setdefault((a["type"], a["id"]), i)
+            self._approval_rows_by_type.setdefault(a["type"], []).append(i)
+        self._approval_type_counts = Counter(a["type"] for a in self.state["approvals"])
+        self._approval_status_counts = Counter(a["status"] for a in self.state["approvals"])
+        # Decisions are appended in created_at order; list_decisions can then skip the sort
+        created = [d["created_at"] for d in self.state["decisions"]]
+        self._decisions_ordered = all(a <= b for a, b in zip(created, created[1:]))
     
     def _load(self) -> Dict:
+        state = None
         try:
             if self.db_path.exists():
-                with open(self.db_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                state = _loads(self.db_path.read_bytes())
         except:
             pass
-        return {"edi_sequence": {}, "decisions": [], "vault": [], "artifacts": []}
+        if state is None:
+            state = {"edi_sequence": {}, "decisions": [], "vault": [], "artifacts": []}
+        return state
     
-    def _save(self):
+    def _changed(self):
+        """Record a mutation; saved at the end of the open batch, or right away."""
+        self._dirty = True
+        if not self._batch_depth:
+            with self._lock:
+                seq = self._commit()
+            self._sync(seq)
+    
+    def _commit(self) -> int:
+        """Close the current set of mutations (caller holds the lock); returns its sequence, 0 if none."""
+        if not self._dirty:
+            return 0
+        self._dirty = False
+        self._commit_seq += 1
+        return self._commit_seq
+    
+    def _sync(self, seq: int):
+        """Make commit `seq` durable in the snapshot.
+        
+        The DB file is shared with the MCP decision server, which reads
+        edi_sequence and the lists straight from it, so it has to be current
+        after every request and each save rewrites the full file. Saves are
+        group-committed: whoever gets the sync lock first serializes the state
+        under the write lock, then writes, fsyncs and replaces the file with
+        the write lock released. Writers queued behind it find their commit
+        already covered and skip their own save.
+        """
+        if not seq:
+            return
+        with self._sync_lock:
+            if self._saved_seq >= seq:
+                return
+            with self._lock:
+                target = self._commit_seq
+                data = _dumps_db(self.state)
+            self._save(data)
+            self._saved_seq = target
+    
+    @contextlib.contextmanager
+    def batch(self):
+        """Commit all mutations inside the block together.
+        
+        Serializes writers, so batches may run from worker threads. The save
+        happens after the write lock is released and is shared with any
+        concurrent batches (group commit).
+        """
+        seq = 0
+        try:
+            with self._lock:
+                self._batch_depth += 1
+                try:
+                    yield self
+                finally:
+                    self._batch_depth -= 1
+                    if not self._batch_depth:
+                        seq = self._commit()
+        finally:
+            self._sync(seq)
+    
+    def _close(self):
+        """Save anything a failed commit left unsaved at shutdown."""
+        with self._lock:
+            seq = self._commit() or self._commit_seq
+        try:
+            self._sync(seq)
+        except OSError as e:
+            print(f"[Trinity] Could not save database at shutdown: {e}")
+    
+    def _save(self, data: bytes):
+        """Atomically replace the snapshot: write <db>.tmp, fsync, os.replace."""
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.db_path, 'w', encoding='utf-8') as f:
-            json.dump(self.state, f, indent=2, ensure_ascii=False)
+        tmp = self.db_path.with_name(self.db_path.name + ".tmp")
+        with open(tmp, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        # Readers (and a crash) see either the old or the new snapshot, never a torn one
+        os.replace(tmp, self.db_path)
     
     def generate_next_edi(self) -> str:
-        year = datetime.now().year
-        current = self.state["edi_sequence"].get(str(year), 0)
-        next_seq = current + 1
-        self.state["edi_sequence"][str(year)] = next_seq
-        self._save()
+        # Local calendar year, same as datetime.now().year without building a datetime
+        year = time.localtime().tm_year
+        key = str(year)
+        next_seq = self.state["edi_sequence"].get(key, 0) + 1
+        self.state["edi_sequence"][key] = next_seq
+        self._changed()
         return f"EVE-{year}-{next_seq:06d}"
     
     def insert_decision(self, decision: Dict):
-        self.state["decisions"].append(decision)
-        self._save()
+        decisions = self.state["decisions"]
+        if decisions and decision["created_at"] < decisions[-1]["created_at"]:
+            self._decisions_ordered = False
+        decisions.append(decision)
+        self._decisions_by_id.setdefault(decision["eve_decision_id"], decision)
+        self._changed()
     
     def get_decision(self, eve_decision_id: str) -> Optional[Dict]:
-        for d in self.state["decisions"]:
-            if d["eve_decision_id"] == eve_decision_id:
-                return d
-        return None
+        return self._decisions_by_id.get(eve_decision_id)
+    
+    def list_decisions(self, filters: Optional[Dict] = None, limit: Optional[int] = None) -> List[Dict]:
+        """Decisions newest first, optionally filtered and capped at `limit`."""
+        return list(islice(self.iter_decisions(filters), limit))
     
-    def list_decisions(self, filters: Optional[Dict] = None) -> List[Dict]:
-        results = list(self.state["decisions"])
+    def iter_decisions(self, filters: Optional[Dict] = None) -> Iterator[Dict]:
+        """Lazily yield decisions newest first, optionally filtered."""
+        if self._decisions_ordered:
+            results = reversed(self.state["decisions"])
+        else:
+            results = sorted(self.state["decisions"], key=lambda x: x["created_at"], reverse=True)
         if filters:
             if filters.get("decision_type"):
-                results = [d for d in results if d["decision_type"] == filters["decision_type"]]
+                results = (d for d in results if d["decision_type"] == filters["decision_type"])
             if filters.get("status"):
-                results = [d for d in results if d["status"] == filters["status"]]
+                results = (d for d in results if d["status"] == filters["status"])
             if filters.get("system_id"):
-                results = [d for d in results if d["scope"]["system_id"] == filters["system_id"]]
+                results = (d for d in results if d["scope"]["system_id"] == filters["system_id"])
             if filters.get("project_id"):
-                results = [d for d in results if d.get("project_id") == filters["project_id"]]
-        return sorted(results, key=lambda x: x["created_at"], reverse=True)
+                results = (d for d in results if d.get("project_id") == filters["project_id"])
+        return results
     
     def supersede(self, old_edi: str, new_edi: str):
-        for d in self.state["decisions"]:
-            if d["eve_decision_id"] == old_edi:
-                d["status"] = "SUPERSEDED"
-                d["superseded_by"] = new_edi
-                self._save()
-                return
+        d = self._decisions_by_id.get(old_edi)
+        if d is not None:
+            d["status"] = "SUPERSEDED"
+            d["superseded_by"] = new_edi
+            self._changed()
     
     def seal_to_vault(self, eve_decision_id: str, evidence_type: str, payload: Dict) -> Dict:
-        if not eve_decision_id or not re.match(r"^EVE-\d{4}-\d{6}$", eve_decision_id):
+        if not eve_decision_id or not EDI_REGEX.match(eve_decision_id):
             raise ValueError(f"REJECTED: Invalid EVE Decision ID: {eve_decision_id}")
         
-        payload_str = json.dumps(payload, sort_keys=True)
-        payload_hash = hashlib.sha256(payload_str.encode()).hexdigest()
-        sealed_at = datetime.now(timezone.utc).isoformat()
-        vault_proof = hashlib.sha256(f"{payload_hash}:{sealed_at}:EVE-VAULT-v1".encode()).hexdigest()[:32]
+        payload_hash = hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+        sealed_at = _utc_now_iso()
+        # sha256("<payload_hash>:<sealed_at>:EVE-VAULT-v1"), fed piecewise
+        proof = hashlib.sha256(payload_hash.encode())
+        proof.update(b":")
+        proof.update(sealed_at.encode())
+        proof.update(b":EVE-VAULT-v1")
+        vault_proof = proof.hexdigest()[:32]
         
         entry = {
             "eve_decision_id": eve_decision_id,
@@ -297,58 +483,168 @@ class Database:
             "vault_proof": vault_proof
         }
         self.state["vault"].append(entry)
-        self._save()
+        self._vault_by_id.setdefault(eve_decision_id, entry)
+        self._changed()
         return entry
     
     def get_vault_entry(self, eve_decision_id: str) -> Optional[Dict]:
-        for v in self.state["vault"]:
-            if v["eve_decision_id"] == eve_decision_id:
-                return v
-        return None
+        return self._vault_by_id.get(eve_decision_id)
     
     def create_artifact(self, artifact_id: str, content: Optional[str] = None):
-        if not any(a["artifact_id"] == artifact_id for a in self.state["artifacts"]):
-            self.state["artifacts"].append({
+        if artifact_id not in self._artifacts_by_id:
+            artifact = {
                 "artifact_id": artifact_id,
                 "status": "Draft",
                 "content": content,
-                "created_at": datetime.now(timezone.utc).isoformat()
-            })
-            self._save()
+                "created_at": _utc_now_iso()
+            }
+            self.state["artifacts"].append(artifact)
+            self._artifacts_by_id[artifact_id] = artifact
+            self._artifact_status_counts["Draft"] += 1
+            self._epochs["artifacts"] += 1
+            self._changed()
     
     def propose_artifact(self, artifact_id: str):
-        for a in self.state["artifacts"]:
-            if a["artifact_id"] == artifact_id and a["status"] == "Draft":
-                a["status"] = "Proposed"
-                a["frozen_at"] = datetime.now(timezone.utc).isoformat()
-                self._save()
-                return
+        a = self._artifacts_by_id.get(artifact_id)
+        if a is not None and a["status"] == "Draft":
+            a["status"] = "Proposed"
+            self._artifact_status_counts["Draft"] -= 1
+            self._artifact_status_counts["Proposed"] += 1
+            a["frozen_at"] = _utc_now_iso()
+            self._epochs["artifacts"] += 1
+            self._changed()
     
     def link_artifact_to_decision(self, artifact_id: str, eve_decision_id: str):
-        for a in self.state["artifacts"]:
-            if a["artifact_id"] == artifact_id:
-                a["status"] = "Executed"
-                a["eve_decision_id"] = eve_decision_id
-                self._save()
-                return
+        a = self._artifacts_by_id.get(artifact_id)
+        if a is not None:
+            self._artifact_status_counts[a["status"]] -= 1
+            self._artifact_status_counts["Executed"] += 1
+            a["status"] = "Executed"
+            a["eve_decision_id"] = eve_decision_id
+            self._epochs["artifacts"] += 1
+            self._changed()
     
     def get_artifact(self, artifact_id: str) -> Optional[Dict]:
-        for a in self.state["artifacts"]:
-            if a["artifact_id"] == artifact_id:
-                return {"artifact_id": a["artifact_id"], "status": a["status"], "eve_decision_id": a.get("eve_decision_id")}
+        a = self._artifacts_by_id.get(artifact_id)
+        if a is None:
+            return None
+        return {"artifact_id": a["artifact_id"], "status": a["status"], "eve_decision_id": a.get("eve_decision_id")}
+    
+    def etag(self, collection: str) -> str:
+        """Weak ETag for "artifacts" or "approvals", changes whenever that collection does."""
+        return f'W/"{self._etag_base}-{self._epochs[collection]}"'
+    
+    def counts(self) -> Dict:
+        """Decision/artifact totals for /status, maintained without scanning."""
+        return {
+            "decisions": len(self.state["decisions"]),
+            "artifacts": len(self.state["artifacts"]),
+            "artifacts_by_status": dict(self._artifact_status_counts),
+        }
+    
+    def save_approval(self, approval: Dict):
+        """Insert or replace the approval record for (type, id)."""
+        approval["type"] = sys.intern(approval["type"])
+        key = (approval["type"], approval["id"])
+        approvals = self.state["approvals"]
+        pos = self._approval_pos_by_key.get(key)
+        if pos is not None:
+            existing = approvals[pos]
+            self._approval_type_counts[existing["type"]] -= 1
+            self._approval_status_counts[existing["status"]] -= 1
+            # Swap the slot in one assignment; readers streaming or holding the old
+            # record (other threads) see it whole, published dicts are never mutated
+            approvals[pos] = approval
+        else:
+            approvals.append(approval)
+            self._approval_pos_by_key[key] = len(approvals) - 1
+            self._approval_rows_by_type.setdefault(approval["type"], []).append(len(approvals) - 1)
+        self._approval_type_counts[approval["type"]] += 1
+        self._approval_status_counts[approval["status"]] += 1
+        self._epochs["approvals"] += 1
+        self._changed()
+    
+    def iter_approvals(self, type: Optional[str] = None, after: Optional[int] = None) -> Iterator[tuple]:
+        """(position, record) in insertion order; a position works as a keyset cursor for `after`."""
+        approvals = self.state["approvals"]
+        if type is None:
+            start = 0 if after is None else after + 1
+            return enumerate(islice(approvals, start, None), start)
+        rows = self._approval_rows_by_type.get(type, [])
+        start = 0 if after is None else bisect_right(rows, after)
+        return ((i, approvals[i]) for i in islice(rows, start, None))
+    
+    def approval_counts(self) -> Dict:
+        """Approval totals by type and status, maintained without scanning."""
+        return {
+            "total": len(self.state["approvals"]),
+            "by_type": dict(self._approval_type_counts),
+            "by_status": dict(self._approval_status_counts),
+        }
+    
+    def get_approval(self, item_id: str, type: Optional[str] = None) -> Optional[Dict]:
+        if type is not None:
+            pos = self._approval_pos_by_key.get((type, item_id))
+            return None if pos is None else self.state["approvals"][pos]
+        for a in self.state["approvals"]:
+            if a["id"] == item_id:
+                return a
         return None
     
     def list_artifacts(self) -> List[Dict]:
-        return [{"artifact_id": a["artifact_id"], "status": a["status"], "eve_decision_id": a.get("eve_decision_id")} for a in self.state["artifacts"]]
+        return list(self.iter_artifacts())
+    
+    def iter_artifacts(self) -> Iterator[Dict]:
+        return ({"artifact_id": a["artifact_id"], "status": a["status"], "eve_decision_id": a.get("eve_decision_id")} for a in self.state["artifacts"])
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # ECL PARSER (Deterministic)
 # ═══════════════════════════════════════════════════════════════════════════════
 
+def _ecl_use_case(params: Dict, rest: str):
+    match = USE_CASE_VALUE_REGEX.match(rest.lstrip())
+    params["use_case"] = match.group(1) or match.group(2) if match else ""
+
+
+def _ecl_artifacts(params: Dict, rest: str):
+    params["artifacts"] = [a.strip() for a in rest.split(",") if a.strip()]
+
+
+def _ecl_risk_links(params: Dict, rest: str):
+    params["risk_links"] = [r.strip() for r in rest.split(",") if r.strip()]
+
+
+def _ecl_signoff(params: Dict, rest: str):
+    params["signoff"] = []
+    for s in rest.split(","):
+        if ":" in s:
+            role, actor = s.strip().split(":", 1)
+            params["signoff"].append({"role": role.strip(), "actor_id": actor.strip()})
+
+
+def _ecl_project(params: Dict, rest: str):
+    params["project_id"] = rest.strip()
+
+
+def _ecl_supersedes(params: Dict, rest: str):
+    params["supersedes"] = rest.strip()
+
+
+_ECL_BODY_HANDLERS = {
+    "USE_CASE": _ecl_use_case,
+    "ARTIFACTS": _ecl_artifacts,
+    "RISK_LINKS": _ecl_risk_links,
+    "SIGNOFF": _ecl_signoff,
+    "PROJECT": _ecl_project,
+    "SUPERSEDES": _ecl_supersedes,
+}
+
+
 class ECLParser:
-    VALID_DECISION_COMMANDS = [c.value for c in ECLDecisionCommand]
-    VALID_READ_COMMANDS = ["QUERY", "REPLAY", "VERIFY"]
+    VALID_DECISION_COMMANDS = frozenset(c.value for c in ECLDecisionCommand)
+    VALID_READ_COMMANDS = frozenset(["QUERY", "REPLAY", "VERIFY"])
+    VALID_COMMANDS_MSG = ", ".join([c.value for c in ECLDecisionCommand] + ["QUERY", "REPLAY", "VERIFY"])
     
     def parse(self, input_str: str) -> Dict:
         input_str = input_str.strip()
@@ -382,7 +678,7 @@ class ECLParser:
         is_read = verb in self.VALID_READ_COMMANDS
         
         if not is_decision and not is_read:
-            return {"success": False, "errors": [f"Unknown command: {verb}. Valid: {', '.join(self.VALID_DECISION_COMMANDS + self.VALID_READ_COMMANDS)}"]}
+            return {"success": False, "errors": [f"Unknown command: {verb}. Valid: {self.VALID_COMMANDS_MSG}"]}
         
         params = {}
         
@@ -392,26 +688,12 @@ class ECLParser:
         elif len(parts) >= 3 and parts[1].upper() == "DECISION":
             params["eve_decision_id"] = parts[2]
         
-        # Parse body
+        # Parse body: one keyword lookup per line
         for line in lines[1:]:
-            upper = line.upper()
-            if upper.startswith("USE_CASE "):
-                match = re.match(r'USE_CASE\s+"([^"]+)"|USE_CASE\s+(.+)', line, re.I)
-                params["use_case"] = match.group(1) or match.group(2) if match else ""
-            elif upper.startswith("ARTIFACTS "):
-                params["artifacts"] = [a.strip() for a in line[10:].split(",") if a.strip()]
-            elif upper.startswith("RISK_LINKS "):
-                params["risk_links"] = [r.strip() for r in line[11:].split(",") if r.strip()]
-            elif upper.startswith("SIGNOFF "):
-                params["signoff"] = []
-                for s in line[8:].split(","):
-                    if ":" in s:
-                        role, actor = s.strip().split(":", 1)
-                        params["signoff"].append({"role": role.strip(), "actor_id": actor.strip()})
-            elif upper.startswith("PROJECT "):
-                params["project_id"] = line[8:].strip()
-            elif upper.startswith("SUPERSEDES "):
-                params["supersedes"] = line[11:].strip()
+            keyword, _, rest = line.partition(" ")
+            handler = _ECL_BODY_HANDLERS.get(keyword.upper())
+            if handler:
+                handler(params, rest)
         
         errors = []
         if is_decision and not params.get("system_id"):
@@ -479,14 +761,14 @@ class ECLValidator:
         if not params.get("system_id"):
             errors.append(f"{verb} requires system_id")
         
-        artifacts = params.get("artifacts", [])
-        for prefix, min_count in rules.get("required_artifacts", []):
-            matching = [a for a in artifacts if a.upper().startswith(prefix.upper())]
-            if len(matching) < min_count:
-                errors.append(f"{verb} requires {min_count} artifact(s) with prefix '{prefix}'. Found: {len(matching)}")
+        artifacts = [a.upper() for a in params.get("artifacts", [])]
+        for prefix, prefix_upper, min_count in ARTIFACT_PREFIXES.get(cmd_enum, []):
+            found = sum(1 for a in artifacts if a.startswith(prefix_upper))
+            if found < min_count:
+                errors.append(f"{verb} requires {min_count} artifact(s) with prefix '{prefix}'. Found: {found}")
         
         signoffs = params.get("signoff", [])
-        provided_roles = [s["role"] for s in signoffs]
+        provided_roles = {s["role"] for s in signoffs}
         for required_role in rules.get("required_roles", []):
             if required_role not in provided_roles:
                 errors.append(f"{verb} requires signoff from: '{required_role}'")
@@ -531,7 +813,9 @@ class DecisionEngine:
         if not validation["valid"]:
             return {"success": False, "errors": validation["errors"], "warnings": validation["warnings"]}
         
-        return self._execute_decision(command, validation["warnings"])
+        # One snapshot write per decision (EDI, decision, vault seal, artifact links)
+        with self.db.batch():
+            return self._execute_decision(command, validation["warnings"])
     
     def validate(self, ecl_input: str) -> Dict:
         parse_result = self.parser.parse(ecl_input)
@@ -606,20 +890,19 @@ class DecisionEngine:
             "signoff": params.get("signoff")
         }, sort_keys=True)
         
-        rules_hash = hashlib.sha256(json.dumps(VALIDATION_RULES, sort_keys=True, default=str).encode()).hexdigest()[:8]
-        
         return {
             "eve_decision_id": eve_decision_id,
             "project_id": project_id,
             "hash_version": hash_version,
             "decision_type": COMMAND_TO_DECISION_TYPE[ECLDecisionCommand(verb)].value,
             "status": "EXECUTED",
-            "created_at": datetime.now(timezone.utc).isoformat(),
+            "created_at": _utc_now_iso(),
+            # Defaults apply only to absent keys; an explicit null is stored as null
             "executed_by": [{"role": s["role"], "actor_id": s["actor_id"], "approval_method": "explicit_signoff"} for s in params.get("signoff", [])],
             "scope": {"system_id": params.get("system_id", ""), "use_case": params.get("use_case", "")},
             "source_artifacts": params.get("artifacts", []),
             "risk_links": params.get("risk_links"),
-            "rule_set_version": f"eve-ruleset-v1.0-{rules_hash}",
+            "rule_set_version": RULE_SET_VERSION,
             "context_hash": hashlib.sha256(context_data.encode()).hexdigest(),
             "supersedes": params.get("supersedes")
         }
@@ -698,7 +981,8 @@ class DecisionEngine:
 app = FastAPI(
     title="EVE Trinity API",
     description="The only place where truth is created. Port 8000.",
-    version=TRINITY_VERSION
+    version=TRINITY_VERSION,
+    default_response_class=DefaultResponse
 )
 
 app.add_middleware(
@@ -709,9 +993,20 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large JSON responses (/decisions, approvals lists); small replies pass through
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 engine = DecisionEngine()
 
 
+async def _db_write(fn, *args, **kwargs):
+    """Run a DB write (and its snapshot save) in a worker thread, off the event loop."""
+    def run():
+        with engine.db.batch():
+            return fn(*args, **kwargs)
+    return await asyncio.to_thread(run)
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # ENDPOINTS
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -729,26 +1024,26 @@ async def root():
 
 @app.get("/status")
 async def status():
-    decisions = engine.db.list_decisions()
-    artifacts = engine.db.list_artifacts()
+    counts = engine.db.counts()
+    by_status = counts["artifacts_by_status"]
     return {
         "service": "EVE Trinity API",
         "version": TRINITY_VERSION,
         "status": "ONLINE",
         "offline_capable": True,
-        "decisions_count": len(decisions),
-        "artifacts_count": len(artifacts),
+        "decisions_count": counts["decisions"],
+        "artifacts_count": counts["artifacts"],
         "artifacts_by_status": {
-            "Draft": len([a for a in artifacts if a["status"] == "Draft"]),
-            "Proposed": len([a for a in artifacts if a["status"] == "Proposed"]),
-            "Executed": len([a for a in artifacts if a["status"] == "Executed"])
+            "Draft": by_status.get("Draft", 0),
+            "Proposed": by_status.get("Proposed", 0),
+            "Executed": by_status.get("Executed", 0)
         }
     }
 
 
 @app.post("/execute_ecl")
 async def execute_ecl(request: ECLRequest):
-    result = engine.execute(request.ecl_command, project_id=request.project_id)
+    result = await _db_write(engine.execute, request.ecl_command, project_id=request.project_id)
     if not result["success"]:
         raise HTTPException(status_code=400, detail=result)
     return result
@@ -781,8 +1076,34 @@ async def get_decision(eve_decision_id: str):
     return decision
 
 
+def _stream_list(key: str, rows: Iterator[Dict], count_key: Optional[str] = "count", chunk_rows: int = 256,
+                 trailer: Optional[Callable[[], Dict]] = None) -> Iterator[bytes]:
+    """Encode {key: [...], count_key: n} row by row, flushing every `chunk_rows`.
+    
+    `trailer` is called once the rows are exhausted; its fields are appended to the object.
+    """
+    yield b'{' + _dumps_compact(key) + b':['
+    count = 0
+    chunk = []
+    for d in rows:
+        chunk.append(_dumps_compact(d))
+        count += 1
+        if len(chunk) == chunk_rows:
+            yield (b"," if count > chunk_rows else b"") + b",".join(chunk)
+            chunk = []
+    if chunk:
+        yield (b"," if count > len(chunk) else b"") + b",".join(chunk)
+    tail = b"]"
+    if count_key is not None:
+        tail += b',' + _dumps_compact(count_key) + b':' + str(count).encode()
+    if trailer is not None:
+        for k, v in trailer().items():
+            tail += b',' + _dumps_compact(k) + b':' + _dumps_compact(v)
+    yield tail + b"}"
+
+
 @app.get("/decisions")
-async def list_decisions(decision_type: Optional[str] = None, system_id: Optional[str] = None, status: Optional[str] = None, project_id: Optional[str] = None):
+async def list_decisions(decision_type: Optional[str] = None, system_id: Optional[str] = None, status: Optional[str] = None, project_id: Optional[str] = None, limit: Optional[int] = Query(None, ge=0)):
     filters = {}
     if decision_type:
         filters["decision_type"] = decision_type
@@ -793,25 +1114,32 @@ async def list_decisions(decision_type: Optional[str] = None, system_id: Optiona
     if project_id:
         filters["project_id"] = project_id
     
-    decisions = engine.db.list_decisions(filters)
-    return {"count": len(decisions), "decisions": decisions}
+    decisions = islice(engine.db.iter_decisions(filters), limit)
+    return StreamingResponse(_stream_list("decisions", decisions), media_type="application/json")
 
 
 @app.post("/artifact/create")
 async def create_artifact(request: CreateArtifactRequest):
-    engine.db.create_artifact(request.artifact_id, request.content)
+    await _db_write(engine.db.create_artifact, request.artifact_id, request.content)
     return {"success": True, "artifact_id": request.artifact_id, "status": "Draft"}
 
 
 @app.post("/artifact/propose")
 async def propose_artifact(request: ProposeArtifactRequest):
-    engine.db.propose_artifact(request.artifact_id)
+    await _db_write(engine.db.propose_artifact, request.artifact_id)
     return {"success": True, "artifact_id": request.artifact_id, "status": "Proposed"}
 
 
 @app.get("/artifacts")
-async def list_artifacts():
-    return {"artifacts": engine.db.list_artifacts()}
+async def list_artifacts(request: Request):
+    etag = engine.db.etag("artifacts")
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return StreamingResponse(
+        _stream_list("artifacts", engine.db.iter_artifacts(), count_key=None),
+        media_type="application/json",
+        headers={"ETag": etag}
+    )
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -833,82 +1161,137 @@ class RejectRequest(BaseModel):
     reason: Optional[str] = None
 
 
-# Approval Registry - stored in database
-def _get_approvals(db: Database) -> List[Dict]:
-    """Get approvals list from database state."""
-    if "approvals" not in db.state:
-        db.state["approvals"] = []
-    return db.state["approvals"]
+# Stored approval records. Always built with the keys in this order so every
+# record in db.state["approvals"] has the same layout.
+class ApprovalRecord(TypedDict):
+    type: str
+    id: str
+    status: str
+    approved_by: str
+    approved_at: str
+    note: Optional[str]
+    content_hash: str
+    sealed_at: str
 
 
+class RejectionRecord(TypedDict):
+    type: str
+    id: str
+    status: str
+    rejected_by: str
+    rejected_at: str
+    reason: Optional[str]
+
+
+# Approval Registry - stored in database
 def _save_approval(db: Database, approval: Dict):
     """Save approval to database."""
-    approvals = _get_approvals(db)
-    # Remove existing if any
-    approvals = [a for a in approvals if not (a["type"] == approval["type"] and a["id"] == approval["id"])]
-    approvals.append(approval)
-    db.state["approvals"] = approvals
-    db._save()
+    db.save_approval(approval)
+
+
+# Knowledge-release git sync status per item id. In memory only: it is not
+# persisted, so it is lost on restart, and only the most recent
+# GIT_SYNC_STATUS_MAX items are kept (least recently updated evicted first).
+GIT_SYNC_STATUS_MAX = 1000
+_git_sync_status: "OrderedDict[str, Dict]" = OrderedDict()
+_git_sync_lock = threading.Lock()
+
+
+def _set_git_sync_status(item_id: str, status: Dict):
+    with _git_sync_lock:
+        _git_sync_status.pop(item_id, None)
+        _git_sync_status[item_id] = status
+        while len(_git_sync_status) > GIT_SYNC_STATUS_MAX:
+            _git_sync_status.popitem(last=False)
+
+
+def _git_sync(on_trinity_approve, payload: Dict):
+    """Commit/push an approved knowledge item (BackgroundTasks runs this in a worker thread)."""
+    item_id = payload["id"]
+    _set_git_sync_status(item_id, {"status": "running", "eve_id": payload["eve_id"]})
+    try:
+        result = on_trinity_approve(payload)
+        print(f"[Trinity] Git commit: {result}")
+        _set_git_sync_status(item_id, {"status": "done", "eve_id": payload["eve_id"], "result": result})
+    except Exception as e:
+        print(f"[Trinity] Git sync failed: {e}")
+        _set_git_sync_status(item_id, {"status": "failed", "eve_id": payload["eve_id"], "error": str(e)})
 
 
 @app.get("/api/v1/trinity/approvals/status")
-async def approval_registry_status():
-    """Approval Registry status - used by Artifact Approval UI."""
-    approvals = _get_approvals(engine.db)
+async def approval_registry_status(request: Request, response: Response):
+    """Approval Registry status - used by Artifact Approval UI.
+    
+    The UI polls this; an unchanged registry answers 304 to If-None-Match.
+    """
+    etag = engine.db.etag("approvals")
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    counts = engine.db.approval_counts()
+    by_type = counts["by_type"]
+    by_status = counts["by_status"]
     return {
         "registry_enabled": True,
         "service": "EVE Trinity Approval Registry",
         "version": TRINITY_VERSION,
-        "total_approvals": len(approvals),
+        "total_approvals": counts["total"],
         "by_type": {
-            "artifact": len([a for a in approvals if a["type"] == "artifact"]),
-            "knowledge": len([a for a in approvals if a["type"] == "knowledge"])
+            "artifact": by_type.get("artifact", 0),
+            "knowledge": by_type.get("knowledge", 0)
         },
         "by_status": {
-            "APPROVED": len([a for a in approvals if a["status"] == "APPROVED"]),
-            "APPROVED_WITH_NOTE": len([a for a in approvals if a["status"] == "APPROVED_WITH_NOTE"]),
-            "REJECTED": len([a for a in approvals if a["status"] == "REJECTED"])
+            "APPROVED": by_status.get("APPROVED", 0),
+            "APPROVED_WITH_NOTE": by_status.get("APPROVED_WITH_NOTE", 0),
+            "REJECTED": by_status.get("REJECTED", 0)
         }
     }
 
 
 @app.get("/api/v1/trinity/approvals")
-async def list_approvals(type: Optional[str] = None):
-    """List approvals, optionally filtered by type."""
-    approvals = _get_approvals(engine.db)
+async def list_approvals(type: Optional[str] = None, limit: Optional[int] = Query(None, ge=0), after: Optional[int] = Query(None, ge=0)):
+    """List approvals, optionally filtered by type.
     
-    if type:
-        approvals = [a for a in approvals if a["type"] == type]
+    With `limit`, a full page carries `next_after`; pass it back as `after` for the next page.
+    """
+    page = {"rows": 0, "last": None}
     
-    return {
-        "count": len(approvals),
-        "items": approvals
-    }
+    def rows():
+        for pos, a in islice(engine.db.iter_approvals(type or None, after), limit):
+            page["rows"] += 1
+            page["last"] = pos
+            yield a
+    
+    def trailer():
+        full = limit is not None and page["rows"] == limit
+        return {"next_after": page["last"] if full else None}
+    
+    return StreamingResponse(_stream_list("items", rows(), trailer=trailer), media_type="application/json")
 
 
 @app.post("/api/v1/trinity/approvals/approve")
-async def approve_item(request: ApprovalRequest):
+async def approve_item(request: ApprovalRequest, background: BackgroundTasks):
     """Approve an artifact or knowledge item with X-Vault seal.
     
     After approval, automatically syncs to evidence_chain for Ask EVE.
+    The git sync runs after the response; poll .../{id}/git_status for it.
     """
-    ts = datetime.now(timezone.utc).isoformat()
+    ts = _utc_now_iso()
     
     # Create content hash for X-Vault
-    content_data = json.dumps({
-        "type": request.type,
-        "id": request.id,
-        "approved_by": request.approved_by,
-        "note": request.note,
-        "timestamp": ts
-    }, sort_keys=True)
+    # Same bytes as json.dumps({...}, sort_keys=True), keys written in sorted order
+    dumps = json.dumps
+    content_data = (
+        f'{{"approved_by": {dumps(request.approved_by)}, "id": {dumps(request.id)}, '
+        f'"note": {dumps(request.note)}, "timestamp": {dumps(ts)}, "type": {dumps(request.type)}}}'
+    )
     content_hash = hashlib.sha256(content_data.encode()).hexdigest()
     
     # Determine status
     status = "APPROVED_WITH_NOTE" if request.note else "APPROVED"
     
     # Create approval record
-    approval = {
+    approval: ApprovalRecord = {
         "type": request.type,
         "id": request.id,
         "status": status,
@@ -920,7 +1303,7 @@ async def approve_item(request: ApprovalRequest):
     }
     
     # Save to database
-    _save_approval(engine.db, approval)
+    await _db_write(_save_approval, engine.db, approval)
     
     # ═══════════════════════════════════════════════════════════════════════
     # AUTO-SYNC TO KNOWLEDGE-RELEASES (Git → GitHub → Cloud)
@@ -929,20 +1312,19 @@ async def approve_item(request: ApprovalRequest):
     if request.type == "knowledge":
         try:
             from knowledge_release_pipeline import on_trinity_approve
-            
-            # Get article content from documents
-            git_result = on_trinity_approve({
+        except ImportError as e:
+            print(f"[Trinity] Knowledge release pipeline not available: {e}")
+        else:
+            eve_id = await _db_write(engine.db.generate_next_edi)
+            _set_git_sync_status(request.id, {"status": "pending", "eve_id": eve_id})
+            background.add_task(_git_sync, on_trinity_approve, {
                 "type": request.type,
                 "id": request.id,
-                "eve_id": engine.db.generate_next_edi(),
+                "eve_id": eve_id,
                 "approved_by": request.approved_by,
                 "content": {}  # Content loaded from documents/
             })
-            print(f"[Trinity] Git commit: {git_result}")
-        except ImportError as e:
-            print(f"[Trinity] Knowledge release pipeline not available: {e}")
-        except Exception as e:
-            print(f"[Trinity] Git sync failed: {e}")
+            git_result = "pending"
     # ═══════════════════════════════════════════════════════════════════════
     
     return {
@@ -953,13 +1335,26 @@ async def approve_item(request: ApprovalRequest):
     }
 
 
+@app.get("/api/v1/trinity/approvals/{item_id}/git_status")
+async def get_git_sync_status(item_id: str):
+    """Status of the background knowledge-release git sync for an approved item.
+    
+    In memory only: syncs from before a restart, or evicted past
+    GIT_SYNC_STATUS_MAX newer ones, return 404 even if they ran.
+    """
+    status = _git_sync_status.get(item_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail=f"No git sync status in memory for: {item_id}")
+    return status
+
+
 @app.post("/api/v1/trinity/approvals/reject")
 async def reject_item(request: RejectRequest):
     """Reject an artifact or knowledge item."""
-    ts = datetime.now(timezone.utc).isoformat()
+    ts = _utc_now_iso()
     
     # Create rejection record
-    rejection = {
+    rejection: RejectionRecord = {
         "type": request.type,
         "id": request.id,
         "status": "REJECTED",
@@ -969,7 +1364,7 @@ async def reject_item(request: RejectRequest):
     }
     
     # Save to database
-    _save_approval(engine.db, rejection)
+    await _db_write(_save_approval, engine.db, rejection)
     
     return {
         "success": True,
@@ -981,12 +1376,9 @@ async def reject_item(request: RejectRequest):
 @app.get("/api/v1/trinity/approvals/{item_id}")
 async def get_approval(item_id: str, type: Optional[str] = None):
     """Get approval status for a specific item."""
-    approvals = _get_approvals(engine.db)
-    
-    for a in approvals:
-        if a["id"] == item_id:
-            if type is None or a["type"] == type:
-                return a
+    approval = engine.db.get_approval(item_id, type)
+    if approval is not None:
+        return approval
     
     raise HTTPException(status_code=404, detail=f"Approval not found: {item_id}")
 
@@ -1006,7 +1398,7 @@ async def list_projects():
     if not PROJECT_REGISTRY_AVAILABLE:
         raise HTTPException(status_code=503, detail="Project Registry not available")
     
-    return list_all_projects()
+    return Response(content=list_all_projects_json(), media_type="application/json")
 
 
 @app.get("/api/projects/{project_id}")
@@ -1031,35 +1423,40 @@ async def get_project(project_id: str):
 # ═══════════════════════════════════════════════════════════════════════════════
 
 if __name__ == "__main__":
-    print()
-    print("═" * 70)
-    print("  EVE TRINITY API — Port 8000")
-    print("  'The only place where truth is created.'")
-    print("═" * 70)
-    print(f"  Version:        {TRINITY_VERSION}")
-    print(f"  Database:       {DB_PATH}")
-    print(f"  Offline:        ✓ Fully capable")
-    print(f"  Claude:         ✗ Not required")
-    print("═" * 70)
-    print()
-    print("  Endpoints:")
-    print("    POST /execute_ecl     — Execute ECL, create Decision")
-    print("    POST /validate_ecl    — Validate without executing")
-    print("    POST /verify          — Verify decision integrity")
-    print("    POST /replay          — Replay decision")
-    print("    GET  /decision/{id}   — Get decision by ID")
-    print("    GET  /decisions       — List decisions")
-    print("    GET  /status          — System status")
-    print("    GET  /artifacts       — List artifacts")
-    print()
-    print("  Project Registry (read-only):")
-    print("    GET  /api/projects         — List all projects")
-    print("    GET  /api/projects/{id}    — Get single project")
-    print()
-    print("═" * 70)
-    print("  Open in browser: http://127.0.0.1:8000")
-    print("  API Docs:        http://127.0.0.1:8000/docs")
-    print("═" * 70)
-    print()
-    
-    uvicorn.run(app, host="127.0.0.1", port=8000)
+    # One write for the whole banner
+    print("\n".join([
+        "",
+        "═" * 70,
+        "  EVE TRINITY API — Port 8000",
+        "  'The only place where truth is created.'",
+        "═" * 70,
+        f"  Version:        {TRINITY_VERSION}",
+        f"  Database:       {DB_PATH}",
+        f"  Offline:        ✓ Fully capable",
+        f"  Claude:         ✗ Not required",
+        "═" * 70,
+        "",
+        "  Endpoints:",
+        "    POST /execute_ecl     — Execute ECL, create Decision",
+        "    POST /validate_ecl    — Validate without executing",
+        "    POST /verify          — Verify decision integrity",
+        "    POST /replay          — Replay decision",
+        "    GET  /decision/{id}   — Get decision by ID",
+        "    GET  /decisions       — List decisions",
+        "    GET  /status          — System status",
+        "    GET  /artifacts       — List artifacts",
+        "",
+        "  Project Registry (read-only):",
+        "    GET  /api/projects         — List all projects",
+        "    GET  /api/projects/{id}    — Get single project",
+        "",
+        "═" * 70,
+        "  Open in browser: http://127.0.0.1:8000",
+        "  API Docs:        http://127.0.0.1:8000/docs",
+        "═" * 70,
+        "",
+    ]))
+    
+    # "auto" picks uvloop + httptools when installed (uvicorn[standard]) and
+    # falls back to asyncio + h11 otherwise - uvloop has no Windows build
+    uvicorn.run(app, host="127.0.0.1", port=8000, loop="auto", http="auto")
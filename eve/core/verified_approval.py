@@ -21,12 +21,24 @@ APPROVE_SEAL_SEPARATION = ENFORCED
 
 import hashlib
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone
 from typing import Dict, Optional, List, Tuple
 from pathlib import Path
 from enum import Enum
 
+# Valfritt: orjson för snabbare (de)serialisering av artifacts (faller tillbaka på stdlib json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Övre gräns för parallell inläsning av artifact-filer vid start
+MAX_LOAD_WORKERS = os.cpu_count() or 1
+
 # Lokala imports
 from approver_registry import ApproverRegistry, ApproverRole, IdentityStrength
 from x_vault.x_vault import XVault, EvidenceType, EvidenceObject
@@ -107,25 +119,48 @@ class VerifiedApprovalManager:
         self.artifacts: Dict[str, Artifact] = {}
         self._load_artifacts()
     
+    @staticmethod
+    def _parse_artifact_file(f: Path):
+        """Läs och tolka en artifact-fil; returnerar Artifact eller felet"""
+        try:
+            if ORJSON_AVAILABLE:
+                data = orjson.loads(f.read_bytes())
+            else:
+                data = json.loads(f.read_text(encoding='utf-8'))
+            return Artifact.from_dict(data)
+        except Exception as e:
+            return e
+    
     def _load_artifacts(self):
         """Ladda artifacts från disk"""
-        if self.ARTIFACTS_PATH.exists():
-            for f in self.ARTIFACTS_PATH.glob("*.json"):
-                try:
-                    data = json.loads(f.read_text(encoding='utf-8'))
-                    artifact = Artifact.from_dict(data)
-                    self.artifacts[artifact.artifact_id] = artifact
-                except Exception as e:
-                    print(f"Warning: Could not load {f}: {e}")
+        if not self.ARTIFACTS_PATH.exists():
+            return
+        paths = list(self.ARTIFACTS_PATH.glob("*.json"))
+        if not paths:
+            return
+        # I/O-bundet: läs filerna parallellt, map() behåller ordningen
+        workers = min(MAX_LOAD_WORKERS, len(paths))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(self._parse_artifact_file, paths))
+        for f, result in zip(paths, results):
+            if isinstance(result, Exception):
+                print(f"Warning: Could not load {f}: {result}")
+            else:
+                self.artifacts[result.artifact_id] = result
     
     def _save_artifact(self, artifact: Artifact):
         """Spara artifact till disk"""
         self.ARTIFACTS_PATH.mkdir(parents=True, exist_ok=True)
         path = self.ARTIFACTS_PATH / f"{artifact.artifact_id}.json"
-        path.write_text(
-            json.dumps(artifact.to_dict(), indent=2, ensure_ascii=False),
-            encoding='utf-8'
-        )
+        if ORJSON_AVAILABLE:
+            # Samma layout som json.dumps(indent=2, ensure_ascii=False)
+            data = orjson.dumps(artifact.to_dict(), option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            data = json.dumps(artifact.to_dict(), indent=2, ensure_ascii=False).encode('utf-8')
+        # Skriv till .tmp och byt atomärt, så en krasch aldrig lämnar en halv artifact
+        tmp = path.with_suffix('.json.tmp')
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
     
     # =========================================================================
     # SUBMIT (draft → submitted)
@@ -551,17 +586,19 @@ class VerifiedApprovalManager:
         checks["content_hash_valid"] = computed == artifact.content_hash
         
         # Approval
-        checks["approval_exists"] = artifact.approval is not None
-        if artifact.approval:
-            checks["approval_signed"] = len(artifact.approval.signature) == 64
-            approver = self.registry.get_approver(artifact.approval.approver_id)
+        approval = artifact.approval
+        checks["approval_exists"] = approval is not None
+        if approval:
+            checks["approval_signed"] = len(approval.signature) == 64
+            approver = self.registry.get_approver(approval.approver_id)
             checks["approver_authorized"] = approver is not None and approver.can_verify_trinity
         
         # X-Vault
-        checks["x_vault_exists"] = artifact.x_vault is not None
-        if artifact.x_vault:
-            checks["snapshot_exists"] = bool(artifact.x_vault.snapshot_id)
-            checks["merkle_root_exists"] = bool(artifact.x_vault.merkle_root)
+        x_vault = artifact.x_vault
+        checks["x_vault_exists"] = x_vault is not None
+        if x_vault:
+            checks["snapshot_exists"] = bool(x_vault.snapshot_id)
+            checks["merkle_root_exists"] = bool(x_vault.merkle_root)
         
         # Invarianter
         errors = artifact.validate_invariants()
@@ -574,8 +611,8 @@ class VerifiedApprovalManager:
             "valid": valid,
             "checks": checks,
             "verified_at": artifact.verified_at,
-            "approver": artifact.approval.approver_name if artifact.approval else None,
-            "merkle_root": artifact.x_vault.merkle_root if artifact.x_vault else None
+            "approver": approval.approver_name if approval else None,
+            "merkle_root": x_vault.merkle_root if x_vault else None
         }
     
     def get_trust_chain(self, artifact_id: str) -> Dict:
@@ -612,8 +649,8 @@ class VerifiedApprovalManager:
         approver_key: str
     ) -> str:
         """Skapa signatur (förenklad för demo)"""
-        payload = f"{artifact_id}:{artifact_hash}:{approver_id}:{timestamp}"
-        sign_data = f"{payload}:{approver_key}"
+        # En sträng och en encode; samma bytes som tidigare payload + ":" + nyckel
+        sign_data = f"{artifact_id}:{artifact_hash}:{approver_id}:{timestamp}:{approver_key}"
         return hashlib.sha256(sign_data.encode()).hexdigest()
     
     def list_by_status(self, status: ArtifactStatus) -> List[Artifact]:
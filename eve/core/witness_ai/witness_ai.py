@@ -272,10 +272,13 @@ class MockKnowledgeBase:
     
     def search(self, query: str, scope: List[str]) -> List[Dict]:
         """Sök i mock-dokumenten"""
+        # Scope-prefix (t.ex. "eu/ai_act/**" -> "eu/ai_act/") räknas ut en gång per sökning
+        prefixes = tuple(s.rstrip('*') for s in scope)
+        
         results = []
         for doc_id, doc in self.documents.items():
             # Kontrollera scope
-            in_scope = any(doc_id.startswith(s.rstrip('*')) for s in scope)
+            in_scope = doc_id.startswith(prefixes)
             if not in_scope:
                 continue
                 
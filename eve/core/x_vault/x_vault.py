@@ -235,38 +235,70 @@ class XVault:
         Returns:
             EvidenceObject med hash och Merkle-path
         """
-        timestamp = datetime.now(timezone.utc).isoformat()
+        return self.seal_batch([(evidence_type, content, metadata)])[0]
+    
+    def seal_batch(
+        self,
+        items: List[Tuple[EvidenceType, Dict, Optional[Dict]]]
+    ) -> List[EvidenceObject]:
+        """
+        Försegla flera evidence objects i ett svep.
         
-        # Hash content
-        content_hash = hashlib.sha256(
-            json.dumps(content, sort_keys=True, ensure_ascii=False).encode()
-        ).hexdigest()
+        Alla löv läggs till innan Merkle-trädet byggs om, så trädet
+        byggs en gång per batch i stället för en gång per objekt.
+        Kedjan (previous_hash) följer listans ordning.
         
-        # Lägg till i Merkle-träd
-        self.merkle_tree.add_leaf(content_hash)
-        leaf_index = len(self.merkle_tree.leaves) - 1
-        merkle_proof = self.merkle_tree.get_proof(leaf_index)
-        merkle_path = [f"{h}:{p}" for h, p in merkle_proof]
+        Args:
+            items: Lista av (evidence_type, content, metadata)
+            
+        Returns:
+            EvidenceObjects i samma ordning som items
+        """
+        if not items:
+            return []
         
-        # Skapa signatur
-        signature = self._sign(content_hash, timestamp)
+        timestamp = datetime.now(timezone.utc).isoformat()
         
-        evidence = EvidenceObject(
-            evidence_id=str(uuid4()),
-            evidence_type=evidence_type,
-            timestamp=timestamp,
-            content_hash=content_hash,
-            content=content,
-            merkle_path=merkle_path,
-            previous_hash=self.last_hash,
-            signature=signature,
-            metadata=metadata or {}
-        )
+        # Hash content
+        content_hashes = [
+            hashlib.sha256(
+                json.dumps(content, sort_keys=True, ensure_ascii=False).encode()
+            ).hexdigest()
+            for _, content, _ in items
+        ]
         
-        self.evidence_chain.append(evidence)
-        self.last_hash = content_hash
+        # Lägg till i Merkle-träd (en ombyggnad för hela batchen)
+        first_index = len(self.merkle_tree.leaves)
+        self.merkle_tree.leaves.extend(content_hashes)
+        self.merkle_tree._build_tree()
+        
+        sealed = []
+        for offset, ((evidence_type, content, metadata), content_hash) in enumerate(
+            zip(items, content_hashes)
+        ):
+            merkle_proof = self.merkle_tree.get_proof(first_index + offset)
+            merkle_path = [f"{h}:{p}" for h, p in merkle_proof]
+            
+            # Skapa signatur
+            signature = self._sign(content_hash, timestamp)
+            
+            evidence = EvidenceObject(
+                evidence_id=str(uuid4()),
+                evidence_type=evidence_type,
+                timestamp=timestamp,
+                content_hash=content_hash,
+                content=content,
+                merkle_path=merkle_path,
+                previous_hash=self.last_hash,
+                signature=signature,
+                metadata=metadata or {}
+            )
+            
+            self.evidence_chain.append(evidence)
+            self.last_hash = content_hash
+            sealed.append(evidence)
         
-        return evidence
+        return sealed
     
     def create_snapshot(self, knowledge_version: str) -> Snapshot:
         """
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Trinity Database Sanity Tests
+=============================
+Tests atomic snapshot writes of the shared DB file and approval paging.
+Runs offline against a temporary DB — no server needed.
+
+© 2026 Organiq Sweden AB
+"""
+
+import sys
+import os
+import json
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+os.environ["CAS_PROBE_DISABLED"] = "1"
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "eve", "core"))
+
+import trinity_api
+from trinity_api import Database
+
+try:
+    from fastapi.testclient import TestClient  # needs httpx
+except ImportError:
+    TestClient = None
+
+passed = 0
+failed = 0
+
+
+def test(name, condition, detail=""):
+    global passed, failed
+    if condition:
+        print(f"  ✅ {name}")
+        passed += 1
+    else:
+        print(f"  ❌ {name} — {detail}")
+        failed += 1
+
+
+def section(title):
+    print(f"\n{'─' * 60}")
+    print(f"🧪 {title}")
+    print('─' * 60)
+
+
+def decision(eve_decision_id, created_at):
+    return {
+        "eve_decision_id": eve_decision_id,
+        "status": "EXECUTED",
+        "created_at": created_at,
+        "decision_type": "CLASSIFICATION",
+        "scope": {"system_id": "test-sys", "use_case": "Test"},
+    }
+
+
+print("=" * 60)
+print("TRINITY DATABASE SANITY TESTS")
+print("=" * 60)
+
+tmp_dir = Path(tempfile.mkdtemp(prefix="eve-db-test-"))
+db_path = tmp_dir / "eve-db.json"
+
+# ═══════════════════════════════════════════════════════════════
+# TEST 1: Snapshot is current after every write
+# ═══════════════════════════════════════════════════════════════
+
+section("Test 1: Shared snapshot is current after every write")
+
+db = Database(db_path)
+edi = db.generate_next_edi()
+snapshot = json.loads(db_path.read_text(encoding="utf-8"))
+test("EDI sequence on disk right after generate_next_edi",
+     snapshot["edi_sequence"] == db.state["edi_sequence"], f"got {snapshot['edi_sequence']}")
+
+with db.batch():
+    db.insert_decision(decision(edi, "2026-01-01T00:00:00+00:00"))
+    db.save_approval({"type": "artifact", "id": "A-1", "status": "APPROVED"})
+snapshot = json.loads(db_path.read_text(encoding="utf-8"))
+test("Batch: decision in snapshot", [d["eve_decision_id"] for d in snapshot["decisions"]] == [edi])
+test("Batch: approval in snapshot", len(snapshot["approvals"]) == 1)
+test("No temp snapshot left behind", not list(tmp_dir.glob("*.tmp")))
+
+published = db.get_approval("A-1", "artifact")
+db.save_approval({"type": "artifact", "id": "A-1", "status": "APPROVED_WITH_NOTE", "note": "ok"})
+test("Replaced approval: published record left untouched", published == {"type": "artifact", "id": "A-1", "status": "APPROVED"})
+test("Replaced approval: same list slot",
+     db.state["approvals"] == [db.get_approval("A-1", "artifact")] and db.get_approval("A-1")["status"] == "APPROVED_WITH_NOTE")
+test("Replaced approval: counters follow",
+     db.approval_counts()["by_status"].get("APPROVED") == 0 and db.approval_counts()["by_status"]["APPROVED_WITH_NOTE"] == 1)
+db._close()
+
+# ═══════════════════════════════════════════════════════════════
+# TEST 2: Reload and crash mid-save
+# ═══════════════════════════════════════════════════════════════
+
+section("Test 2: Reload sees every committed write; a crash mid-save is harmless")
+
+db = Database(db_path)
+year = edi.split("-")[1]
+test("Reload: EDI sequence", db.state["edi_sequence"][year] == 1, f"got {db.state['edi_sequence']}")
+test("Reload: decision and approval", db.get_decision(edi) is not None and len(db.state["approvals"]) == 1)
+test("Next EDI continues after reload", db.generate_next_edi() == f"EVE-{year}-000002")
+db._close()
+
+# A crash while writing the snapshot leaves only a partial <db>.tmp behind
+before = db_path.read_bytes()
+(tmp_dir / "eve-db.json.tmp").write_bytes(b'{"edi_sequence": {"20')
+db = Database(db_path)
+test("Partial temp file never replaces the snapshot", db_path.read_bytes() == before)
+test("Snapshot still loads intact", db.state["edi_sequence"][year] == 2 and len(db.state["decisions"]) == 1)
+edi3 = db.generate_next_edi()
+db.insert_decision(decision(edi3, "2026-01-03T00:00:00+00:00"))
+test("Next save replaces the stale temp file", not list(tmp_dir.glob("*.tmp")))
+db._close()
+
+db = Database(db_path)
+test("Writes after a crash survive reload", db.get_decision(edi3) is not None)
+db._close()
+
+# ═══════════════════════════════════════════════════════════════
+# TEST 3: Group commit across writer threads
+# ═══════════════════════════════════════════════════════════════
+
+section("Test 3: Group commit across writer threads")
+
+db = Database(db_path)
+saves = []
+original_save = db._save
+
+
+def slow_save(data):
+    saves.append(data)
+    time.sleep(0.05)  # long enough for other writers to commit meanwhile
+    original_save(data)
+
+
+db._save = slow_save
+
+
+def writer(i):
+    with db.batch():
+        db.save_approval({"type": "knowledge", "id": f"K-{i}", "status": "APPROVED"})
+
+
+threads = [threading.Thread(target=writer, args=(i,)) for i in range(8)]
+for t in threads:
+    t.start()
+for t in threads:
+    t.join()
+test("Fewer snapshot saves than commits", 1 <= len(saves) < 8, f"{len(saves)} saves for 8 commits")
+snapshot = json.loads(db_path.read_text(encoding="utf-8"))
+test("Every concurrent commit reached the snapshot",
+     {a["id"] for a in snapshot["approvals"]} >= {f"K-{i}" for i in range(8)})
+db._close()
+
+# ═══════════════════════════════════════════════════════════════
+# TEST 4: Approvals keyset cursor (limit / after / next_after)
+# ═══════════════════════════════════════════════════════════════
+
+section("Test 4: Approvals keyset cursor")
+
+db = Database(tmp_dir / "eve-db-approvals.json")
+for i in range(7):
+    db.save_approval({"type": "artifact" if i % 2 else "knowledge", "id": f"ID-{i}", "status": "APPROVED"})
+# Replacing a record keeps its position, so cursors handed out earlier stay valid
+db.save_approval({"type": "artifact", "id": "ID-1", "status": "REJECTED"})
+
+test("iter_approvals: all in insertion order",
+     [a["id"] for _, a in db.iter_approvals()] == [f"ID-{i}" for i in range(7)])
+test("iter_approvals: type index",
+     [pos for pos, _ in db.iter_approvals("artifact")] == [1, 3, 5])
+test("iter_approvals: after a position (no type)",
+     [pos for pos, _ in db.iter_approvals(None, 4)] == [5, 6])
+test("iter_approvals: after a position (with type)",
+     [pos for pos, _ in db.iter_approvals("knowledge", 2)] == [4, 6])
+
+if TestClient is None:
+    print("  ⏭️  HTTP paging skipped (fastapi.testclient/httpx not installed)")
+else:
+    trinity_api.engine.db = db
+    client = TestClient(trinity_api.app)
+    
+    def walk(**params):
+        """Follow next_after until it is null; returns (ids, pages)."""
+        ids, after, pages = [], None, 0
+        while True:
+            query = dict(params, limit=2)
+            if after is not None:
+                query["after"] = after
+            body = client.get("/api/v1/trinity/approvals", params=query).json()
+            ids += [a["id"] for a in body["items"]]
+            pages += 1
+            after = body["next_after"]
+            if after is None:
+                return ids, pages
+    
+    ids, pages = walk()
+    test("Paging without type: every record once, in order",
+         ids == [f"ID-{i}" for i in range(7)], f"got {ids}")
+    test("Paging without type: 4 pages of 2", pages == 4, f"got {pages}")
+    
+    ids, pages = walk(type="artifact")
+    test("Paging with type: only that type, in order", ids == ["ID-1", "ID-3", "ID-5"], f"got {ids}")
+    test("Paging with type: 2 pages of 2", pages == 2, f"got {pages}")
+    
+    body = client.get("/api/v1/trinity/approvals").json()
+    test("No limit: full list, next_after null", body["count"] == 7 and body["next_after"] is None)
+    
+    test("Negative limit rejected with 422",
+         client.get("/api/v1/trinity/approvals", params={"limit": -1}).status_code == 422)
+    test("Negative after rejected with 422",
+         client.get("/api/v1/trinity/approvals", params={"after": -1}).status_code == 422)
+db._close()
+
+# ═══════════════════════════════════════════════════════════════
+# SUMMARY
+# ═══════════════════════════════════════════════════════════════
+
+print("\n" + "=" * 60)
+total = passed + failed
+print(f"RESULTS: {passed}/{total} passed, {failed} failed")
+if failed == 0:
+    print("🟢 ALL TESTS PASSED")
+else:
+    print("🔴 FAILURES DETECTED — Review before proceeding")
+print("=" * 60)